@@ -7,16 +7,24 @@
 import asyncio
 import sys
 import pygame as pg
+from src.settings import HEADLESS_FRAMES
 from src.game import Game
 
 
 async def main():
     game = Game()
+    frames = 0
 
     while game.is_running:
         game.update()
         await asyncio.sleep(0)  # do not forget that one, it must be called on every frame
 
+        # benchmark runs stop by themselves after a fixed number of frames
+        frames += 1
+
+        if HEADLESS_FRAMES and frames >= HEADLESS_FRAMES:
+            game.is_running = False
+
     # Closing the game (not strictly required)
     pg.quit()
     sys.exit()
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from src.settings import *
+from src.util.timer import Timer
+from src.monster import Monster
+from random import random
+from math import floor
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.sprites.player import Player
+    from src.overlays.battle import Battle
+    from src.overlays.transition import Transition
+    from src.textures.monster_patch_texture import MonsterPatchTexture
+
+
+class Encounters:
+    def __init__(self, player: Player, battle: Battle, transition: Transition) -> None:
+        self.player = player
+        self.battle = battle
+        self.transition = transition
+
+        # tile -> patch covering it
+        self.patches: dict[tuple[int, int], MonsterPatchTexture] = {}
+
+        # patch under the player, only looked up when the player changes tile
+        self.tile: tuple[int, int] | None = None
+        self.patch: MonsterPatchTexture | None = None
+
+        # the wild monsters of the next encounter, built ahead of time
+        self.monsters: list[Monster] = []
+        self.monsters_key: tuple | None = None
+
+        # one cadence for every patch on the map
+        self.timer = Timer(ENCOUNTER_INTERVAL, True, True, self.check_encounter)
+
+    def patch_tiles(self, patch: MonsterPatchTexture) -> list[tuple[int, int]]:
+        left = floor(patch.rect.left / TILE_SIZE)
+        top = floor(patch.rect.top / TILE_SIZE)
+        right = floor((patch.rect.right - 1) / TILE_SIZE)
+        bottom = floor((patch.rect.bottom - 1) / TILE_SIZE)
+
+        return [(x, y) for y in range(top, bottom + 1) for x in range(left, right + 1)]
+
+    def add(self, patch: MonsterPatchTexture) -> None:
+        for tile in self.patch_tiles(patch):
+            self.patches[tile] = patch
+
+    def remove(self, patch: MonsterPatchTexture) -> None:
+        for tile in self.patch_tiles(patch):
+            if self.patches.get(tile) is patch:
+                del self.patches[tile]
+
+        if self.patch is patch:
+            self.tile = None
+            self.patch = None
+
+    def prepare(self) -> None:
+        key = (tuple(self.patch.monster_names), self.patch.level)
+
+        if key != self.monsters_key:
+            self.monsters = [Monster(name, self.patch.level) for name in self.patch.monster_names]
+            self.monsters_key = key
+
+    def check_encounter(self) -> None:
+        # if moving, no battle, on a patch, and random chance
+        if self.patch and \
+           self.player.direction and \
+           not self.battle.in_progress and \
+           random() < ENCOUNTER_CHANCE:
+            self.prepare()
+            monsters = self.monsters
+            biome = self.patch.biome
+
+            # the next encounter gets fresh monsters once this one is over
+            self.monsters_key = None
+
+            self.transition.start(
+                lambda: self.battle.setup(self.player, monsters, True, biome)
+            )
+
+    def update(self) -> None:
+        x, y = self.player.rect.midbottom
+        tile = (floor(x / TILE_SIZE), floor(y / TILE_SIZE))
+
+        if tile != self.tile:
+            self.tile = tile
+            self.patch = self.patches.get(tile)
+
+        if self.patch and not self.battle.in_progress and not self.transition.in_transition:
+            self.prepare()
+
+        self.timer.update()
@@ -1,17 +1,27 @@
 import sys
+from os import environ
 from src.settings import *
 from src.util.imports import *
 from src.util.support import check_connection
-from pytmx import TiledMap, TiledObject
+from src.util.dirty_rects import DirtyRects
+from src.util.bundle import load_bundle
+from src.util.assets import assets
+from src.util.tmx_maps import TmxMaps
+from src.util.triggers import Trigger, TriggerIndex
+from pytmx import TiledObject
 from os.path import join
 from src.textures.texture import Texture
-from src.textures.animated_texture import AnimatedTexture
 from src.textures.monster_patch_texture import MonsterPatchTexture
 from src.textures.collidable_texture import CollidableTexture
 from src.textures.world_texture import WorldTransition
+from src.textures.chunk_layer import ChunkLayer
+from src.textures.animated_chunk_layer import AnimatedChunkLayer
 from src.sprites.player import Player
 from src.sprites.character import Character
-from src.groups import RenderGroup
+from src.groups import RenderGroup, CollisionGroup
+from src.world_cache import BuiltWorld, WorldCache
+from src.regions import Region
+from src.encounters import Encounters
 from src.game_data import *
 from src.overlays.dialog import DialogTree
 from src.overlays.monster_index import MonsterIndex
@@ -19,6 +29,8 @@ from src.overlays.battle import Battle
 from src.overlays.transition import Transition
 from src.overlays.evolution import Evolution
 from src.monster import Monster
+from concurrent.futures import Future
+from typing import Iterator, Generator
 
 
 class World:
@@ -29,6 +41,11 @@ class World:
 
 class Game:
     def __init__(self) -> None:
+        if HEADLESS:
+            # sdl renders into memory and plays into the void
+            environ['SDL_VIDEODRIVER'] = 'dummy'
+            environ['SDL_AUDIODRIVER'] = 'dummy'
+
         pg.init()
 
         self.screen = pg.display.set_mode(
@@ -37,6 +54,8 @@ class Game:
 
         pg.display.set_caption('Monster Quest')
         self.clock = pg.time.Clock()
+        self.dirty_rects = DirtyRects()
+        self.overlay_state: tuple | None = None
 
         # transitions
         self.transition = Transition(self.block_player, self.unblock_player)
@@ -45,11 +64,13 @@ class Game:
         # import all assets
         self.import_assets()
 
-        # groups
+        # groups of the world the player is in, swapped on every world change
+        self.worlds = WorldCache()
         self.render_group = RenderGroup()
-        self.collision_group = pg.sprite.Group()
+        self.collision_group = CollisionGroup()
         self.character_group = pg.sprite.Group()
         self.world_transitions = pg.sprite.Group()
+        self.triggers = TriggerIndex()
 
         self.player_monsters = [
             Monster('Friolera', 30),
@@ -64,27 +85,44 @@ class Game:
         )
 
         self.battle = Battle(
-            self.monster_frames, self.transition, self.ui_icons, self.attack_frames,
-            self.battle_backgrounds, self.audio, self.fonts
+            self.monster_frames, self.monster_outlines, self.transition, self.ui_icons, self.attack_frames,
+            self.battle_backgrounds, self.audio, self.music, self.fonts
         )
 
         self.dialog_tree = DialogTree(self.battle, self.transition, self.render_group)
-        self.evolution = Evolution(
-            self.monster_frames, self.star_frames, self.audio['evolution'], self.fonts['dialog']
-        )
+        self.evolution = Evolution(self.star_frames, self.music, self.fonts['dialog'])
 
-        # essentially start game
+        # essentially start game, there is nothing to show yet so the
+        # first world is built in one go, blocking on a background parse
         self.is_running = True
-        self.setup(self.tmx_maps[self.world.name], self.world.player_start_pos)
+
+        for step in self.setup(self.world):
+            if step is not None:
+                step.result()
 
     def import_assets(self) -> None:
-        self.tmx_maps = import_tmx_maps('data', 'maps')
+        # without an up to date bundle everything is decoded and sliced here
+        graphics = load_bundle() or import_graphics()
 
-        self.overworld_frames = {
-            'water': import_folder('graphics', 'tilesets', 'water'),
-            'coast': import_coast(24, 12, 'graphics', 'tilesets', 'coast'),
-            'characters': import_characters(4, 4, 'graphics', 'characters')
-        }
+        self.tmx_maps = TmxMaps(graphics.get('tmx_maps', {}), 'data', 'maps')
+        self.overworld_frames = graphics['overworld_frames']
+
+        # monster graphics load per species on first use, bundled ones are mapped already
+        for category in ('icons', 'monsters', 'outlines'):
+            if category in graphics:
+                assets.register(category, graphics[category].__getitem__)
+
+        self.monster_frames = assets.category('monsters')
+        self.monster_outlines = assets.category('outlines')
+
+        self.ui_icons = graphics['ui_icons']
+        self.shadow = import_image('graphics', 'other', 'shadow')
+        self.alert = import_image('graphics', 'ui', 'alert')
+        assets.register('ui', self.ui_icons.__getitem__)
+
+        self.battle_backgrounds = graphics['battle_backgrounds']
+        self.attack_frames = graphics['attack_frames']
+        self.star_frames = graphics['star_frames']
 
         self.fonts = {
             'dialog': pg.Font(join('graphics', 'fonts', 'PixeloidSans.ttf'), 30),
@@ -93,155 +131,259 @@ class Game:
             'bold': pg.Font(join('graphics', 'fonts', 'dogicapixelbold.otf'), 22),
         }
 
-        self.monster_frames = import_monster_frames(
-            4, 2, 'graphics', 'monsters'
-        )
+        if sys.platform == "emscripten":
+            self.audio = import_audio('audio/browser')
+            self.music = import_music('audio/browser')
+        else:
+            self.audio = import_audio('audio/os')
+            self.music = import_music('audio/os')
 
-        self.ui_icons = import_folder_dict('graphics', 'ui')
+    def setup(self, world: World) -> Iterator[Future | None]:
+        # yields whenever it may be paused, the transition resumes it over
+        # as many frames as it takes while the old world keeps running.
+        # a yielded future is what the build waits on before going on
+        built_world = self.worlds.get(world.name)
 
-        self.battle_backgrounds = import_folder_dict('graphics', 'backgrounds')
+        # worlds the player left recently are still built
+        if not built_world:
+            self.tmx_maps.prefetch(world.name)
+            parse = self.tmx_maps.pending.get(world.name)
 
-        self.attack_frames = import_attacks(4, 1,  'graphics', 'attacks')
+            while parse and not parse.done():
+                yield parse
 
-        self.star_frames = import_folder('graphics', 'other', 'star-animation')
+            built_world = yield from self.build_world(world.name, world.player_start_pos)
+            self.worlds.add(built_world)
 
-        if sys.platform == "emscripten":
-            self.audio = import_audio('audio/browser')
+        built_world.place_player(world.player_start_pos)
+        built_world.regions.tile = None
+        build, release = built_world.regions.update(built_world.player.rect.center)
+
+        for key in release:
+            built_world.release_region(key)
+            yield
+
+        for key in build:
+            self.build_region(built_world, key)
+            yield
+
+        # the first frame of the new world draws from baked chunks only
+        yield from built_world.render_group.bake_layers(built_world.player.get_center_pos())
+
+        self.enter_world(built_world)
+
+        if self.world.name == 'world':
+            self.music.play('overworld')
         else:
-            self.audio = import_audio('audio/os')
+            self.music.stop()
+
+    def enter_world(self, built_world: BuiltWorld) -> None:
+        self.built_world = built_world
+        self.render_group = built_world.render_group
+        self.collision_group = built_world.collision_group
+        self.character_group = built_world.character_group
+        self.world_transitions = built_world.world_transitions
+        self.triggers = built_world.triggers
+        self.dialog_tree.render_group = self.render_group
 
-    def setup(self, tmx_map: TiledMap, player_start_pos) -> None:
-        self.render_group.empty()
-        self.collision_group.empty()
-        self.character_group.empty()
-        self.world_transitions.empty()
+        self.player = built_world.player
+        self.encounters = built_world.encounters
+        self.triggers.reset()
+
+    def build_world(self, name: str, player_start_pos: str) -> Generator[None, None, BuiltWorld]:
+        tmx_map = self.tmx_maps[name]
+        built_world = BuiltWorld(name, (tmx_map.width, tmx_map.height))
 
         # Terrain
+        terrain_layer = ChunkLayer()
+
+        # row by row, tiles() collects the whole layer before the first tile
         for layer in ['Terrain', 'Terrain Top']:
-            for x, y, surf in tmx_map.get_layer_by_name(layer).tiles():
-                Texture(
-                    (x * TILE_SIZE, y * TILE_SIZE),
-                    surf,
-                    WorldLayer.bg,
-                    self.render_group
-                )
+            for y, row in enumerate(tmx_map.get_layer_by_name(layer).data):
+                for x, gid in enumerate(row):
+                    if gid:
+                        terrain_layer.add((x * TILE_SIZE, y * TILE_SIZE), tmx_map.images[gid])
+
+                yield
+
+        built_world.render_group.add_layer(terrain_layer)
+        yield
 
         obj: TiledObject
 
         # Water
+        water_layer = AnimatedChunkLayer()
+
         for obj in tmx_map.get_layer_by_name('Water'):
             # this is not really a grid with row, col
             # just tiles that act as coords
             for x in range(int(obj.x), int(obj.x + obj.width), TILE_SIZE):
                 for y in range(int(obj.y), int(obj.y + obj.height), TILE_SIZE):
-                    AnimatedTexture(
-                        (x, y),
-                        self.overworld_frames['water'],
-                        WorldLayer.water,
-                        self.render_group
-                    )
+                    water_layer.add((x, y), self.overworld_frames['water'])
+
+            yield
 
         # Coast
         for obj in tmx_map.get_layer_by_name('Coast'):
             pos = (obj.x, obj.y)
             terrain = obj.properties['terrain']
             side = obj.properties['side']
-            frames = self.overworld_frames['coast'][terrain][side]
-            AnimatedTexture(pos, frames, WorldLayer.water, self.render_group)
+            water_layer.add(pos, self.overworld_frames['coast'][terrain][side])
+            yield
 
-        # Objects
-        for obj in tmx_map.get_layer_by_name('Objects'):
-            z = WorldLayer.main
-            pos = (obj.x, obj.y)
-            surf = obj.image
+        built_world.render_group.add_layer(water_layer)
+        yield
 
-            if obj.name == 'top':
-                z = WorldLayer.top
-                Texture(pos, surf, z, self.render_group)
-            else:
-                CollidableTexture(
-                    pos, surf, [self.render_group, self.collision_group]
-                )
+        # objects, colliders, characters and monster patches are only
+        # built for the regions around the player
+        regions = built_world.regions
+
+        for obj in tmx_map.get_layer_by_name('Objects'):
+            regions.add('Objects', obj, obj.image.get_frect(topleft=(obj.x, obj.y)))
+            yield
 
-        # Collisions
         for obj in tmx_map.get_layer_by_name('Collisions'):
-            Texture(
-                (obj.x, obj.y),
-                pg.Surface((obj.width, obj.height)),
-                WorldLayer.main,
-                self.collision_group
-            )
+            regions.add('Collisions', obj, pg.FRect(obj.x, obj.y, obj.width, obj.height))
+            yield
 
         # Worlds
         for obj in tmx_map.get_layer_by_name('Transition'):
             pos = (obj.x, obj.y)
             size = (obj.width, obj.height)
             target = (obj.properties['target'], obj.properties['pos'])
-            WorldTransition(pos, size, target, self.world_transitions)
+            world = WorldTransition(pos, size, target, built_world.world_transitions)
 
-        SHADOW = import_image('graphics', 'other', 'shadow')
-        ALERT = import_image('graphics', 'ui', 'alert')
+            built_world.triggers.add(Trigger(
+                world.rect, lambda target=target: self.change_world(target)
+            ))
+
+            # parse the next map while the player walks up to it
+            built_world.triggers.add(Trigger(
+                world.rect.inflate(MAP_PREFETCH_DISTANCE * 2, MAP_PREFETCH_DISTANCE * 2),
+                lambda name=target[0]: self.tmx_maps.prefetch(name)
+            ))
+            yield
 
         # Entities
         for obj in tmx_map.get_layer_by_name('Entities'):
             frames = self.overworld_frames['characters'][obj.properties['graphic']]
             state = obj.properties['direction']
 
-            # check for player and check starting pos
+            if obj.name == 'Player':
+                built_world.player_starts[obj.properties['pos']] = ((obj.x, obj.y), state)
+
+            # check for player and check starting pos, the player of the
+            # world being left keeps playing until this one is entered
             if obj.name == 'Player' and obj.properties['pos'] == player_start_pos:
-                self.player = Player(
+                built_world.player = Player(
                     (obj.x, obj.y),
                     frames,
                     state,
-                    SHADOW,
-                    ALERT,
+                    self.shadow,
+                    self.alert,
                     self.player_monsters,
-                    self.collision_group,
-                    self.render_group
+                    built_world.collision_group,
+                    built_world.render_group
                 )
+
+                # the player draws in map order too, so it takes its own
+                # slot in the sequence the streamed sprites are ordered by
+                built_world.render_group.set_order(built_world.player, regions.reserve())
             elif obj.name == 'Character':
-                groups = (
-                    self.render_group, self.collision_group, self.character_group
-                )
-                character_data = TRAINER_DATA[obj.properties['character_id']]
-                radius = obj.properties['radius']
+                rect = pg.FRect(0, 0, TILE_SIZE * 2, TILE_SIZE * 2)
+                rect.center = (obj.x, obj.y)
+                regions.add('Entities', obj, rect)
 
-                Character(
-                    (obj.x, obj.y),
-                    frames,
-                    state,
-                    character_data,
-                    radius,
-                    self.player,
+            yield
+
+        # Monsters
+        built_world.encounters = Encounters(built_world.player, self.battle, self.transition)
+
+        for obj in tmx_map.get_layer_by_name('Monsters'):
+            regions.add('Monsters', obj, obj.image.get_frect(topleft=(obj.x, obj.y)))
+            yield
+
+        # streamed sprites draw in map order, whenever they are built
+        built_world.render_group.reserve_orders(regions.count)
+
+        return built_world
+
+    def build_region(self, built_world: BuiltWorld, key: tuple[int, int]) -> None:
+        region = Region()
+        render_group = built_world.render_group
+        collision_group = built_world.collision_group
+
+        obj: TiledObject
+
+        for order, layer, obj in built_world.regions.objects[key]:
+            pos = (obj.x, obj.y)
+
+            if layer == 'Objects':
+                if obj.name == 'top':
+                    sprite = Texture(pos, obj.image, WorldLayer.top, render_group)
+                else:
+                    sprite = CollidableTexture(pos, obj.image, [render_group, collision_group])
+
+            elif layer == 'Collisions':
+                # whole pixel sizes, like the blank surfaces these used to be
+                region.rects.append(collision_group.add_rect(
+                    pg.FRect(obj.x, obj.y, int(obj.width), int(obj.height))
+                ))
+                continue
+
+            elif layer == 'Entities':
+                groups = (render_group, collision_group, built_world.character_group)
+
+                sprite = Character(
+                    pos,
+                    self.overworld_frames['characters'][obj.properties['graphic']],
+                    obj.properties['direction'],
+                    TRAINER_DATA[obj.properties['character_id']],
+                    obj.properties['radius'],
+                    built_world.player,
                     self.dialog_tree,
                     self.fonts['dialog'],
-                    SHADOW,
-                    ALERT,
-                    self.collision_group,
+                    self.shadow,
+                    self.alert,
+                    collision_group,
                     self.audio['notice'],
                     groups
                 )
 
-        # Monsters
-        for obj in tmx_map.get_layer_by_name('Monsters'):
-            z = WorldLayer.main
-            biome = obj.properties['biome']
-            monster_names = str(obj.properties['monsters']).split(',')
-            level = obj.properties['level']
+                built_world.restore_character(order, sprite)
+                region.characters[order] = sprite
 
-            if biome == 'sand':
-                z = WorldLayer.bg
+            else:
+                z = WorldLayer.main
+                biome = obj.properties['biome']
+                monster_names = str(obj.properties['monsters']).split(',')
 
-            MonsterPatchTexture(
-                (obj.x, obj.y), obj.image, z, biome, self.player,
-                monster_names, level, self.battle,
-                self.transition, self.render_group
-            )
+                if biome == 'sand':
+                    z = WorldLayer.bg
 
-        self.audio['overworld'].stop()
+                sprite = MonsterPatchTexture(
+                    pos, obj.image, z, biome, monster_names,
+                    obj.properties['level'], render_group
+                )
 
-        if self.world.name == 'world':
-            self.audio['overworld'].play(-1)
+                built_world.encounters.add(sprite)
+                region.patches.append(sprite)
+
+            render_group.set_order(sprite, order)
+            region.sprites.append(sprite)
+
+        # static colliders are indexed once, characters re-index as they walk
+        collision_group.index_pending()
+        built_world.regions.built[key] = region
+
+    def stream_regions(self) -> None:
+        build, release = self.built_world.regions.update(self.player.rect.center)
+
+        for key in release:
+            self.built_world.release_region(key)
+
+        for key in build:
+            self.build_region(self.built_world, key)
 
     def block_player(self) -> None:
         self.player.block()
@@ -274,24 +416,25 @@ class Game:
             self.player.blocked = False
 
     def check_world_change(self) -> None:
-        world: WorldTransition
+        # the triggers only look around when the hitbox crossed a cell
+        self.triggers.update(self.player.hitbox)
 
-        for world in self.world_transitions:
-            if self.player.hitbox.colliderect(world.rect) and not self.transition.in_transition:
-                self.world = World(world.target[0], world.target[1])
+    def change_world(self, target: tuple[str, str]) -> bool:
+        # turned down for now, the trigger asks again once the running
+        # transition is over and the player is still standing on it
+        if self.transition.in_transition:
+            return False
 
-                self.transition.start(
-                    lambda: self.setup(
-                        self.tmx_maps[self.world.name], self.world.player_start_pos
-                    )
-                )
+        self.world = World(target[0], target[1])
+        self.transition.start(lambda: self.setup(self.world))
+        return True
 
     def end_evolution(self, monster: Monster) -> None:
         monster_evolution = Monster(monster.evolution['name'], monster.evolution['level'])
         index = self.player_monsters.index(monster)
         self.player_monsters[index] = monster_evolution
         self.player.unblock()
-        self.audio['overworld'].play(-1)
+        self.music.play('overworld')
 
     def check_evolution(self) -> None:
         if self.evolution.in_evolution:
@@ -299,7 +442,6 @@ class Game:
 
         for monster in self.player_monsters:
             if monster.should_evolve():
-                self.audio['overworld'].stop()
                 self.player.block()
                 self.evolution.setup(monster, self.end_evolution)
 
@@ -311,6 +453,9 @@ class Game:
                 self.is_running = False
                 return
 
+            if event.type == pg.WINDOWEXPOSED:
+                self.dirty_rects.invalidate()
+
         # handle game input
         self.check_world_change()
 
@@ -323,6 +468,9 @@ class Game:
 
         # handle game logic
         self.render_group.update(dt)
+        self.stream_regions()
+        self.encounters.update()
+        self.music.update()
         self.screen.fill((0, 0, 0))
         self.render_group.draw(self.player.get_center_pos())
 
@@ -345,4 +493,28 @@ class Game:
         if self.transition.in_transition:
             self.transition.update(dt)
 
-        pg.display.update()
+        self.present()
+
+    def present(self) -> None:
+        overlay_state = (
+            self.monster_index.opened, self.dialog_tree.in_dialog,
+            self.battle.in_progress, self.evolution.in_evolution,
+            self.transition.in_transition
+        )
+
+        # battles, evolutions and transitions animate the whole screen and
+        # opening or closing an overlay changes everything underneath it
+        if self.render_group.camera_moved or \
+                overlay_state != self.overlay_state or \
+                self.battle.in_progress or \
+                self.evolution.in_evolution or \
+                self.transition.in_transition:
+            self.dirty_rects.invalidate()
+
+        self.overlay_state = overlay_state
+        self.dirty_rects.extend(self.render_group.dirty_rects)
+
+        if self.monster_index.opened:
+            self.dirty_rects.add(self.monster_index.monster_index_rect)
+
+        self.dirty_rects.present()
@@ -1,11 +1,14 @@
 from __future__ import annotations
 from src.settings import *
-from typing import TYPE_CHECKING
+from src.util.spatial_grid import SpatialGrid, SortedSpatialGrid
+from src.util.collision_grid import CollisionGrid
+from typing import Iterator, TYPE_CHECKING
 
 if TYPE_CHECKING:  # <-try this,
     from src.sprites.entity import Entity
     from src.textures.texture import Texture
     from src.overlays.dialog import DialogSprite
+    from src.textures.chunk_layer import ChunkLayer
 
 
 class RenderGroup(pg.sprite.Group):
@@ -14,21 +17,238 @@ class RenderGroup(pg.sprite.Group):
         self.screen = pg.display.get_surface()
         self.offset = vector()
 
+        # screen rects that changed since the last frame, only meaningful
+        # while the camera stands still
+        self.dirty_rects: list[pg.Rect] = []
+        self.camera_moved = True
+        self.drawn_offset: vector | None = None
+        self.drawn: dict[pg.sprite.Sprite, tuple[pg.Rect, pg.Surface]] = {}
+
+        # baked static layers drawn underneath every sprite
+        self.layers: list[ChunkLayer] = []
+
+        # one bucket per world layer, each indexed by rect so only the sprites
+        # on screen get drawn and each kept in draw order as sprites come and go
+        # bg and fg buckets draw in insertion order, main is y sorted
+        self.buckets = {
+            z: SortedSpatialGrid(self.get_order) for z in WorldLayer
+        }
+        self.buckets[WorldLayer.main] = SortedSpatialGrid(self.get_y_sort)
+
+        self.dynamic_sprites: set[pg.sprite.Sprite] = set()
+        self.pending_sprites: set[pg.sprite.Sprite] = set()
+
+        # insertion order, also breaks ties between equal y sorts
+        self.order: dict[pg.sprite.Sprite, int] = {}
+        self.taken_orders: set[int] = set()
+        self.next_order = 0
+
+    def add_internal(self, sprite: pg.sprite.Sprite, layer=None) -> None:
+        super().add_internal(sprite, layer)
+
+        # sprites join their groups before their rect exists, so they are
+        # indexed right before the next update or draw
+        self.pending_sprites.add(sprite)
+        self.set_order(sprite, self.next_order)
+        self.next_order += 1
+
+    def remove_internal(self, sprite: pg.sprite.Sprite) -> None:
+        super().remove_internal(sprite)
+
+        self.buckets[sprite.z].remove(sprite)
+        self.taken_orders.discard(self.order.pop(sprite, None))
+        self.pending_sprites.discard(sprite)
+        self.dynamic_sprites.discard(sprite)
+
+    def index_pending(self) -> None:
+        for sprite in self.pending_sprites:
+            self.buckets[sprite.z].insert(sprite, sprite.rect)
+
+            if sprite.dynamic:
+                self.dynamic_sprites.add(sprite)
+
+        self.pending_sprites.clear()
+
+    def add_layer(self, layer: ChunkLayer) -> None:
+        self.layers.append(layer)
+
+        # a pan over the world must not evict chunks it is about to draw
+        layer.cache.fit(sum(
+            other.working_set() for other in self.layers if other.cache is layer.cache
+        ))
+
+    def bake_layers(self, player_center: vector) -> Iterator[None]:
+        for layer in self.layers:
+            yield from layer.bake_visible(player_center)
+
+    def reserve_orders(self, count: int) -> None:
+        # the first count orders are handed out with set_order
+        self.next_order = max(self.next_order, count)
+
+    def set_order(self, sprite: pg.sprite.Sprite, order: int) -> None:
+        # sprites streamed in later still draw in the order the map lists
+        # them, has to happen before the sprite gets indexed
+        # the buckets find sprites by (y sort, order), so orders are unique
+        if order in self.taken_orders and self.order.get(sprite) != order:
+            raise ValueError(f'Draw order {order} is already taken.')
+
+        self.taken_orders.discard(self.order.get(sprite))
+        self.order[sprite] = order
+        self.taken_orders.add(order)
+
+    def empty(self) -> None:
+        super().empty()
+
+        for layer in self.layers:
+            layer.empty()
+
+        self.layers.clear()
+        self.next_order = 0
+        self.drawn.clear()
+        self.drawn_offset = None
+
+    def update(self, *args, **kwargs) -> None:
+        super().update(*args, **kwargs)
+        self.index_pending()
+
+        for layer in self.layers:
+            layer.update(*args, **kwargs)
+
+        # only sprites that can move need to be re-indexed, and only the ones
+        # that changed cells or y sort are re-inserted
+        for sprite in self.dynamic_sprites:
+            self.buckets[sprite.z].move(sprite, sprite.rect)
+
+    def get_order(self, sprite: pg.sprite.Sprite) -> int:
+        return self.order[sprite]
+
+    def get_y_sort(self, sprite: pg.sprite.Sprite) -> tuple[float, int]:
+        return (sprite.get_y_sort(), self.order[sprite])
+
+    def get_camera(self) -> pg.FRect:
+        camera = pg.FRect(-self.offset.x, -self.offset.y, WINDOW_WIDTH, WINDOW_HEIGHT)
+
+        # shadows and alerts are drawn slightly outside of a sprite rect
+        return camera.inflate(TILE_SIZE * 2, TILE_SIZE * 2)
+
     def draw(self, player_center: vector):
         # we want the player always in the center, if the player moves right
         # all other sprites move left by -x amount
         self.offset.x = -(player_center.x - WINDOW_WIDTH / 2)
         self.offset.y = -(player_center.y - WINDOW_HEIGHT / 2)
 
-        bg_sprites = filter(lambda sprite: sprite.z < WorldLayer.main, self)
-        main_sprites = filter(lambda sprite: sprite.z == WorldLayer.main, self)
-        main_sprites = sorted(
-            main_sprites, key=lambda sprite: sprite.get_y_sort()
-        )
-        fg_sprites = filter(lambda sprite: sprite.z > WorldLayer.main, self)
+        self.camera_moved = self.offset != self.drawn_offset
+        self.drawn_offset = self.offset.copy()
+        self.dirty_rects = []
+
+        for layer in self.layers:
+            self.dirty_rects.extend(layer.draw(self.offset))
+
+        # the layers share one chunk budget, so chunks are only evicted
+        # once every layer marked what it shows
+        keep = {(layer, key) for layer in self.layers for key in layer.visible}
+
+        for cache in {layer.cache for layer in self.layers}:
+            cache.evict(keep)
+
+        self.index_pending()
+        camera = self.get_camera()
+        drawn: dict[pg.sprite.Sprite, tuple[pg.Rect, pg.Surface]] = {}
 
         sprite: Entity | Texture | DialogSprite
 
-        for sprites in [bg_sprites, main_sprites, fg_sprites]:
-            for sprite in sprites:
-                sprite.draw(self.offset)
+        for z in WorldLayer:
+            for sprite in self.buckets[z].query(camera):
+                drawn[sprite] = (sprite.draw(self.offset), sprite.image)
+
+        self.track_changes(drawn)
+
+    def track_changes(self, drawn: dict[pg.sprite.Sprite, tuple[pg.Rect, pg.Surface]]) -> None:
+        if not self.camera_moved:
+            # a sprite changed if it moved, changed image or (dis)appeared
+            for sprite, state in drawn.items():
+                if self.drawn.get(sprite) != state:
+                    self.dirty_rects.append(state[0])
+
+                    if sprite in self.drawn:
+                        self.dirty_rects.append(self.drawn[sprite][0])
+
+            for sprite in self.drawn.keys() - drawn.keys():
+                self.dirty_rects.append(self.drawn[sprite][0])
+
+        self.drawn = drawn
+
+
+class CollisionGroup(pg.sprite.Group):
+    def __init__(self, size: tuple[int, int] = (0, 0)) -> None:
+        super().__init__()
+
+        # colliders indexed by rect, which always contains the hitbox, static
+        # ones are inserted once and moving ones re-index themselves
+        self.grid = SpatialGrid()
+
+        # invisible colliders are plain rects on a tile grid, not sprites
+        self.tiles = CollisionGrid(size)
+
+        # everything static that blocks the view, invisible colliders and
+        # the full rect of every static sprite
+        self.occluders = CollisionGrid(size)
+        self.occluder_indices: dict[pg.sprite.Sprite, int] = {}
+        self.pending_sprites: set[pg.sprite.Sprite] = set()
+
+        # insertion order, colliders are resolved in the order they were added
+        self.order: dict[pg.sprite.Sprite, int] = {}
+        self.next_order = 0
+
+    def add_internal(self, sprite: pg.sprite.Sprite, layer=None) -> None:
+        super().add_internal(sprite, layer)
+
+        self.pending_sprites.add(sprite)
+        self.order[sprite] = self.next_order
+        self.next_order += 1
+
+    def remove_internal(self, sprite: pg.sprite.Sprite) -> None:
+        super().remove_internal(sprite)
+
+        self.grid.remove(sprite)
+        self.order.pop(sprite, None)
+        self.pending_sprites.discard(sprite)
+
+        if sprite in self.occluder_indices:
+            self.occluders.remove(self.occluder_indices.pop(sprite))
+
+    def index_pending(self) -> None:
+        for sprite in self.pending_sprites:
+            self.grid.insert(sprite, sprite.rect)
+
+            if not sprite.dynamic:
+                self.occluder_indices[sprite] = self.occluders.add(sprite.rect)
+
+        self.pending_sprites.clear()
+
+    def move(self, sprite: pg.sprite.Sprite) -> None:
+        if sprite not in self.pending_sprites:
+            self.grid.move(sprite, sprite.rect)
+
+    def add_rect(self, rect: pg.FRect) -> tuple[int, int]:
+        return self.tiles.add(rect), self.occluders.add(rect)
+
+    def remove_rect(self, indices: tuple[int, int]) -> None:
+        self.tiles.remove(indices[0])
+        self.occluders.remove(indices[1])
+
+    def query(self, rect: pg.FRect) -> list[pg.sprite.Sprite]:
+        self.index_pending()
+
+        return sorted(self.grid.query(rect), key=self.order.__getitem__)
+
+    def query_rects(self, rect: pg.FRect) -> list[pg.FRect]:
+        return self.tiles.query(rect)
+
+    def has_line_of_sight(self, start: tuple[float, float], end: tuple[float, float]) -> bool:
+        self.index_pending()
+
+        return self.occluders.line_of_sight(start, end)
+
+    def hitboxes(self, rect: pg.FRect) -> list[pg.FRect]:
+        return [sprite.hitbox for sprite in self.query(rect)] + self.query_rects(rect)
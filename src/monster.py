@@ -1,6 +1,7 @@
 from src.game_data import MONSTER_DATA
-from src.util.imports import import_image
+from src.util.assets import assets
 from random import randint
+from weakref import finalize
 from src.game_data import ABILITY_DATA
 
 
@@ -29,7 +30,9 @@ class Monster:
                 'level': MONSTER_DATA[self.name]['evolve'][1]
             }
 
-        self.icon = import_image('graphics', 'icons', self.name)
+        # the icon is shared by every monster of a species and let go with the last one
+        self.icon = assets.acquire('icons', self.name)
+        finalize(self, assets.release, 'icons', self.name)
 
     def __repr__(self) -> str:
         return f'{self.name} - {self.level}'
@@ -1,5 +1,6 @@
 from src.settings import *
-from src.util.support import calculate_monster_outlines, flip_surfaces
+from src.util.text import render_text
+from src.util.assets import AssetCategory, assets
 from src.monster import Monster
 from src.sprites.battle_monster import BattleMonster
 from src.game_data import ABILITY_DATA, ELEMENT_DATA
@@ -7,9 +8,10 @@ from src.util.draw import draw_bar
 from random import choice, uniform, randint
 from threading import Timer
 from typing import Callable
+from weakref import finalize
 from src.overlays.transition import Transition
-from copy import deepcopy
 from src.sprites.player import Player
+from src.util.audio import Music
 
 
 class SelectionMode(IntEnum):
@@ -35,22 +37,23 @@ class BattleGroup(pg.sprite.Group):
 class Battle:
     def __init__(
         self,
-        monster_frames: dict[str, dict[str, list[pg.Surface]]], transition: Transition,
+        monster_frames: AssetCategory, monster_outlines: AssetCategory, transition: Transition,
         ui_icons: dict[str, pg.Surface], attack_frames: dict[str, pg.Surface],
-        bg_surfs: dict[str, pg.Surface], audio: dict[str, pg.mixer.Sound], fonts: dict[str, pg.Font]
+        bg_surfs: dict[str, pg.Surface], audio: dict[str, pg.mixer.Sound], music: Music,
+        fonts: dict[str, pg.Font]
     ) -> None:
         self.screen = pg.display.get_surface()
         self.monster_frames = monster_frames
+        self.monster_outlines = monster_outlines
         self.ui_icons = ui_icons
         self.attack_frames = attack_frames
         self.bg_surfs = bg_surfs
         self.bg_surf: pg.Surface | None = None
         self.audio = audio
+        self.music = music
         self.fonts = fonts
         self.transition = transition
 
-        self.monster_outlines = calculate_monster_outlines(self.monster_frames, 4)
-
         self.init()
 
     def init(self) -> None:
@@ -105,35 +108,36 @@ class Battle:
 
         self.in_progress = True
         self.blocked = False
-        self.audio['overworld'].stop()
-        self.audio['battle'].play(-1)
+        self.music.play('battle')
 
     def create_battle_monster(self, id: int, monster: Monster, pos_index: int, entity: str) -> BattleMonster:
-        # since we reuse monster frames this should be a deep copy
-        # this is because we modify the surfaces
-        frames: dict[str, list[pg.Surface]] = deepcopy(self.monster_frames[monster.name])
-        outlines: dict[str, list[pg.Surface]] = deepcopy(
-            self.monster_outlines[monster.name]
-        )
+        # frames are shared between every battle monster, nobody draws on them
+        frames_key = (self.monster_frames.category, monster.name)
+        outlines_key = (self.monster_outlines.category, monster.name)
         groups = [self.battle_sprites]
         pos = NEW_BATTLE_POSITIONS[entity][pos_index]
 
         if entity == PLAYER:
             groups.append(self.player_sprites)
 
-            for state, surfs in frames.items():
-                frames[state] = flip_surfaces(surfs, True, False)
-
-            for state, surfs in outlines.items():
-                outlines[state] = flip_surfaces(surfs, True, False)
+            frames_key = ('mirrored', frames_key)
+            outlines_key = ('mirrored', outlines_key)
 
         else:
             groups.append(self.enemy_sprites)
 
-        BattleMonster(
-            id, pos, monster, frames, self.attack_frames, outlines, entity, self.fonts, groups
+        battle_monster = BattleMonster(
+            id, pos, monster, assets.acquire(*frames_key), self.attack_frames,
+            assets.acquire(*outlines_key), entity, self.fonts, groups
         )
 
+        # like monster icons, frames stay loaded while a battle monster uses
+        # them so they are never evicted and decoded a second time
+        for key in (frames_key, outlines_key):
+            finalize(battle_monster, assets.release, *key)
+
+        return battle_monster
+
     def update_battle_monsters(self, option) -> None:
         paused = True if option == 'pause' else False
 
@@ -305,8 +309,7 @@ class Battle:
         if self.end_battle_callback:
             self.end_battle_callback()
 
-        self.audio['battle'].stop()
-        self.audio['overworld'].play(-1)
+        self.music.play('overworld')
 
         if not self.in_progress:
             for _, monsters in self.monster_data.items():
@@ -385,14 +388,16 @@ class Battle:
                 pg.draw.rect(self.screen, bg_color, item_rect)
                 pg.draw.rect(self.screen, COLORS['dark'], divider_rect)
 
-            ability_surf = self.fonts['regular'].render(ability, False, COLORS['dark'])
+            ability_surf = render_text(
+                self.fonts['regular'], ability, False, COLORS['dark']
+            )
             ability_rect = ability_surf.get_rect(topleft=item_rect.topleft + vector(8, 3))
             self.screen.blit(ability_surf, ability_rect)
 
             ability_data = ABILITY_DATA[ability]
 
-            element_surf = self.fonts['small'].render(
-                ability_data['element'], False, COLORS['dark']
+            element_surf = render_text(
+                self.fonts['small'], ability_data['element'], False, COLORS['dark']
             )
             element_rect = element_surf.get_rect()
 
@@ -406,8 +411,8 @@ class Battle:
             )
             self.screen.blit(element_surf, element_rect)
 
-            ep_cost_surf = self.fonts['small'].render(
-                f'ep: {ability_data['cost']}', False, COLORS['dark']
+            ep_cost_surf = render_text(
+                self.fonts['small'], f'ep: {ability_data['cost']}', False, COLORS['dark']
             )
             ep_cost_rect = ep_cost_surf.get_rect()
             ep_cost_rect.bottomright = item_rect.bottomright + vector(-8, -3)
@@ -470,7 +475,8 @@ class Battle:
 
             self.screen.blit(icon_surf, icon_rect)
 
-            name_surf = self.fonts['small'].render(
+            name_surf = render_text(
+                self.fonts['small'],
                 f'{monster.name} ({monster.level})', False, text_color
             )
             name_rect = name_surf.get_rect(
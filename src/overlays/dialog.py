@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from src.settings import *
+from src.util.text import render_text
 from src.util.timer import Timer
 from typing import TYPE_CHECKING
 from src.overlays.battle import Battle
@@ -20,7 +21,7 @@ class DialogSprite(pg.sprite.Sprite):
 
         self.z = WorldLayer.top
 
-        font_surf = font.render(message, False, COLORS['black'])
+        font_surf = render_text(font, message, False, COLORS['black'])
         font_rect = font_surf.get_frect()
         padding = 30
 
@@ -51,9 +52,10 @@ class DialogSprite(pg.sprite.Sprite):
 
         self.image = surf
         self.rect = self.image.get_frect(midbottom=character.rect.midtop)
+        self.dynamic = False
 
-    def draw(self, offset: vector) -> None:
-        self.screen.blit(
+    def draw(self, offset: vector) -> pg.Rect:
+        return self.screen.blit(
             self.image, self.rect.topleft + offset
         )
 
@@ -1,20 +1,21 @@
 from src.settings import *
+from src.util.text import render_text
+from src.util.assets import assets
 from src.monster import Monster
 from typing import Callable
 from src.util.timer import Timer
+from src.util.audio import Music
 
 
 class Evolution:
     def __init__(
-        self, monster_frames: dict[str, dict[str, list[pg.Surface]]],
-        star_frames: list[pg.Surface], evolution_sound: pg.mixer.Sound, font: pg.Font
+        self, star_frames: list[tuple[pg.Surface, tuple[int, int]]], music: Music, font: pg.Font
     ) -> None:
         self.screen = pg.display.get_surface()
-        self.monster_frames = monster_frames
         self.star_frames = star_frames
         self.font = font
         self.in_evolution = False
-        self.evolution_sound = evolution_sound
+        self.music = music
 
         self.monster: Monster | None
         self.monster_evolution = {
@@ -46,11 +47,12 @@ class Evolution:
         self.monster_evolution = monster.evolution
         self.callback = callback
 
-        self.monster_frame = self.monster_frames[self.monster.name]['idle'][0]
-        self.monster_frame = pg.transform.scale2x(self.monster_frame)
+        # scaled frames and silhouettes are made once per species
+        evolution = assets.get('evolution', self.monster.name)
+        self.monster_frame = evolution['frame']
 
-        self.monster_mask_frame = pg.mask.from_surface(self.monster_frame).to_surface()
-        self.monster_mask_frame.set_colorkey('black')
+        # only one evolution runs at a time, so fading the shared silhouette is fine
+        self.monster_mask_frame = evolution['silhouette']
         self.monster_mask_frame.set_alpha(0)
 
         self.monster_frame_rect = self.monster_frame.get_rect(
@@ -59,19 +61,23 @@ class Evolution:
 
         self.monster_mask_alpha = 0
 
-        self.monster_evolution_frame = self.monster_frames[self.monster_evolution['name']]['idle'][0]
-        self.monster_evolution_frame = pg.transform.scale2x(self.monster_evolution_frame)
+        self.monster_evolution_frame = assets.get(
+            'evolution', self.monster_evolution['name']
+        )['frame']
         self.monster_evolution_frame_rect = self.monster_evolution_frame.get_rect(
             center=(WINDOW_WIDTH / 2, WINDOW_HEIGHT / 2)
         )
 
         self.timers['start'].activate()
-        self.evolution_sound.play()
+        self.music.play('evolution', 0)
 
     def start_finish_timer(self) -> None:
         self.timers['finish'].activate()
 
     def end_evolution(self) -> None:
+        # the callback fades into whatever plays next
+        self.music.stop()
+
         if self.callback != None:
             self.callback(self.monster)
 
@@ -87,7 +93,6 @@ class Evolution:
 
         self.monster_frame = None
         self.monster_evolution_frame = None
-        self.evolution_sound.stop()
 
     def draw_star_animation(self, dt: float) -> None:
         self.star_frame_index += 24 * dt
@@ -95,11 +100,9 @@ class Evolution:
         if self.star_frame_index > len(self.star_frames):
             return
 
-        star_frame = pg.transform.scale2x(self.star_frames[int(self.star_frame_index)])
-        star_frame_rect = star_frame.get_rect(
-            center=(WINDOW_WIDTH / 2, WINDOW_HEIGHT / 2)
-        )
-        self.screen.blit(star_frame, star_frame_rect)
+        # the scaled frame is centered, only its visible part is drawn
+        star_frame, offset = self.star_frames[int(self.star_frame_index)]
+        self.screen.blit(star_frame, vector(WINDOW_WIDTH / 2, WINDOW_HEIGHT / 2) + offset)
 
     def update_timers(self) -> None:
         for timer in self.timers.values():
@@ -114,8 +117,8 @@ class Evolution:
             self.screen.blit(self.monster_frame, self.monster_frame_rect)
             self.screen.blit(self.monster_mask_frame, self.monster_frame_rect)
 
-            text_surf = self.font.render(
-                f'{self.monster.name} is evolving', False, COLORS['black']
+            text_surf = render_text(
+                self.font, f'{self.monster.name} is evolving', False, COLORS['black']
             )
             bg_rect = text_surf.get_rect().inflate(75, 15)
             bg_rect.midtop = self.monster_frame_rect.midbottom + vector(0, 10)
@@ -132,7 +135,8 @@ class Evolution:
                 self.monster_evolution_frame, self.monster_evolution_frame_rect
             )
 
-            text_surf = self.font.render(
+            text_surf = render_text(
+                self.font,
                 f'{self.monster.name} evolved into {self.monster_evolution['name']}',
                 False, COLORS['black']
             )
@@ -1,4 +1,6 @@
 from src.settings import *
+from src.util.text import render_text
+from src.util.assets import AssetCategory
 from src.monster import Monster
 from src.util.draw import draw_bar
 from src.util.imports import import_folder_dict
@@ -7,7 +9,7 @@ from src.game_data import ABILITY_DATA
 
 class MonsterIndex:
     def __init__(
-        self, monsters: list[Monster], monster_frames: dict[str, dict[str, list[pg.Surface]]],
+        self, monsters: list[Monster], monster_frames: AssetCategory,
         ui_icons: dict[str, pg.Surface], fonts: dict[str, pg.Font]
     ) -> None:
         self.screen = pg.display.get_surface()
@@ -63,8 +65,8 @@ class MonsterIndex:
             pg.FRect(0, 0, 60, 20), border_radius=10
         )
 
-        element_text = self.fonts['small'].render(
-            monster.element, False, COLORS['black']
+        element_text = render_text(
+            self.fonts['small'], monster.element, False, COLORS['black']
         )
 
         self.screen.blit(element, element_rect)
@@ -86,8 +88,8 @@ class MonsterIndex:
     def draw_monster_name(
         self, item_rect: pg.FRect, monster: Monster, text_color: str
     ) -> tuple[pg.Surface, pg.FRect]:
-        monster_name = self.fonts['regular'].render(
-            monster.name, False, text_color
+        monster_name = render_text(
+            self.fonts['regular'], monster.name, False, text_color
         )
 
         monster_name_rect = monster_name.get_frect(
@@ -176,8 +178,8 @@ class MonsterIndex:
         )
 
     def draw_main_level(self, monster: Monster, rect: pg.FRect) -> None:
-        level_surf = self.fonts['regular'].render(
-            f'lvl: {monster.level}', False, COLORS['white']
+        level_surf = render_text(
+            self.fonts['regular'], f'lvl: {monster.level}', False, COLORS['white']
         )
         level_rect = level_surf.get_frect(
             bottomleft=rect.bottomleft + vector(10, -16)
@@ -192,8 +194,8 @@ class MonsterIndex:
 
     def draw_main_element(self, monster: Monster, rect: pg.FRect) -> None:
         # draw element
-        element_surf = self.fonts['regular'].render(
-            monster.element, False, COLORS['white']
+        element_surf = render_text(
+            self.fonts['regular'], monster.element, False, COLORS['white']
         )
         element_rect = element_surf.get_frect(
             bottomright=rect.bottomright + vector(-10, -10)
@@ -201,8 +203,8 @@ class MonsterIndex:
         self.screen.blit(element_surf, element_rect)
 
     def draw_main_name(self, monster: Monster, rect: pg.FRect) -> None:
-        name_surf = self.fonts['bold'].render(
-            monster.name, False, COLORS['white']
+        name_surf = render_text(
+            self.fonts['bold'], monster.name, False, COLORS['white']
         )
         name_rect = name_surf.get_frect(
             topleft=rect.topleft + vector(10, 10)
@@ -219,7 +221,8 @@ class MonsterIndex:
             COLORS['black'], COLORS['blue'], border_radius=2
         )
 
-        energy_bar_text_surf = self.fonts['regular'].render(
+        energy_bar_text_surf = render_text(
+            self.fonts['regular'],
             f'EP: {int(monster.energy)}/{monster.get_stat('max_energy')}',
             False, COLORS['white']
         )
@@ -242,7 +245,8 @@ class MonsterIndex:
             COLORS['black'], COLORS['red'], border_radius=2
         )
 
-        health_bar_text_surf = self.fonts['regular'].render(
+        health_bar_text_surf = render_text(
+            self.fonts['regular'],
             f'HP: {int(monster.health)}/{monster.get_stat('max_health')}',
             False, COLORS['white']
         )
@@ -267,8 +271,8 @@ class MonsterIndex:
         self.screen.blit(monster_surf, monster_rect)
 
     def draw_main_stats(self, monster: Monster, stats_rect: pg.FRect) -> None:
-        title_surf = self.fonts['regular'].render(
-            'Stats', False, COLORS['white']
+        title_surf = render_text(
+            self.fonts['regular'], 'Stats', False, COLORS['white']
         )
         title_rect = title_surf.get_frect(topleft=stats_rect.topleft)
         self.screen.blit(title_surf, title_rect)
@@ -291,8 +295,8 @@ class MonsterIndex:
             self.screen.blit(icon_surf, icon_rect)
 
             # text
-            stat_text = self.fonts['regular'].render(
-                stat, False, COLORS['white']
+            stat_text = render_text(
+                self.fonts['regular'], stat, False, COLORS['white']
             )
             stat_text_rect = stat_text.get_frect(
                 top=item_rect.top,
@@ -350,8 +354,8 @@ class MonsterIndex:
 
         abilities_rect = stats_rect.copy().move_to(left=energy_bar_rect.left)
 
-        title_surf = self.fonts['regular'].render(
-            'Abilities', False, COLORS['white']
+        title_surf = render_text(
+            self.fonts['regular'], 'Abilities', False, COLORS['white']
         )
         title_rect = title_surf.get_frect(topleft=abilities_rect.topleft)
         self.screen.blit(title_surf, title_rect)
@@ -365,8 +369,8 @@ class MonsterIndex:
         row = 0
 
         for name in monster.get_abilities():
-            ability_surf = self.fonts['regular'].render(
-                name, False, COLORS['black']
+            ability_surf = render_text(
+                self.fonts['regular'], name, False, COLORS['black']
             )
 
             ability_bg_rect = ability_surf.get_frect().inflate(20, 6)
@@ -1,5 +1,6 @@
 from src.settings import *
-from typing import Callable
+from time import perf_counter
+from typing import Callable, Iterator
 
 
 class Transition:
@@ -11,6 +12,10 @@ class Transition:
         self.tint_progress = 0
         self.tint_complete = False
         self.callback: Callable | None = None
+
+        # what the callback started building, advanced while fully tinted
+        self.builder: Iterator | None = None
+        self.step_cost = 0.0
         self.start_callback = start_callback
         self.end_callback = end_callback
 
@@ -23,6 +28,24 @@ class Transition:
         if self.start_callback:
             self.start_callback()
 
+    def build(self) -> None:
+        start = perf_counter()
+        deadline = start + SETUP_FRAME_BUDGET / 1000
+
+        for step in self.builder:
+            now = perf_counter()
+            self.step_cost = max(self.step_cost, now - start)
+            start = now
+
+            # a step yielding something is waiting on it, e.g. a map parsed
+            # in the background, spinning would only slow that down.
+            # the next step is expected to cost as much as the longest one
+            # so far and is left for the next frame if it would not fit
+            if step is not None or now + self.step_cost >= deadline:
+                return
+
+        self.builder = None
+
     def update(self, dt) -> None:
         if not self.in_transition or self.tint_mode == None:
             return
@@ -36,12 +59,21 @@ class Transition:
 
         self.tint_progress = max(0, min(255, self.tint_progress))
 
-        if self.tint_progress == 255:
-            if self.callback:
-                self.callback()
+        if self.tint_progress == 255 and not self.tint_complete:
+            if self.callback and not self.builder:
+                self.builder = self.callback()
+                self.step_cost = 0.0
+
+            # a callback returning an iterator keeps the screen dark until
+            # it is exhausted, spending at most the budget on it each frame
+            if isinstance(self.builder, Iterator):
+                self.build()
+            else:
+                self.builder = None
 
-            self.tint_mode = 'untint'
-            self.tint_complete = True
+            if not self.builder:
+                self.tint_mode = 'untint'
+                self.tint_complete = True
 
         # transition complete
         if self.tint_complete and self.tint_progress == 0:
@@ -53,6 +85,12 @@ class Transition:
             if self.end_callback:
                 self.end_callback()
 
+        # a fully tinted screen is plain black and stays that way for the
+        # whole build, an opaque blit costs many times more than a fill
+        if self.tint_progress == 255:
+            self.screen.fill((0, 0, 0))
+            return
+
         # keep tint progress between 0 and 255
         self.tint.set_alpha(self.tint_progress)
         self.screen.blit(self.tint, self.tint.get_rect())
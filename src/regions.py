@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from src.settings import *
+from src.util.spatial_grid import SpatialGrid
+from pytmx import TiledObject
+from math import floor
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.sprites.character import Character
+    from src.textures.monster_patch_texture import MonsterPatchTexture
+
+
+class Region:
+    def __init__(self) -> None:
+        # everything built for the region, so it can be released again
+        self.sprites: list[pg.sprite.Sprite] = []
+        self.rects: list[tuple[int, int]] = []
+        self.characters: dict[int, Character] = {}
+        self.patches: list[MonsterPatchTexture] = []
+
+
+class Regions:
+    def __init__(self, size: int = REGION_SIZE * TILE_SIZE) -> None:
+        self.size = size
+
+        # region -> (map order, layer name, object) of everything it builds
+        self.objects: dict[tuple[int, int], list[tuple[int, str, TiledObject]]] = {}
+        self.count = 0
+
+        # objects stick out of their region, so regions are scheduled by
+        # the bounds of what they build rather than their square
+        self.bounds: dict[tuple[int, int], pg.FRect] = {}
+        self.grid = SpatialGrid(size)
+
+        self.built: dict[tuple[int, int], Region] = {}
+        self.tile: tuple[int, int] | None = None
+
+    def add(self, layer: str, obj: TiledObject, rect: pg.FRect) -> None:
+        key = (floor(rect.centerx / self.size), floor(rect.centery / self.size))
+        self.objects.setdefault(key, []).append((self.count, layer, obj))
+        self.count += 1
+
+        self.bounds[key] = self.bounds[key].union(rect) if key in self.bounds else rect.copy()
+        self.grid.insert(key, self.bounds[key])
+
+    def reserve(self) -> int:
+        # a map order for something that is built up front
+        order = self.count
+        self.count += 1
+
+        return order
+
+    def update(self, center: tuple[float, float]) -> tuple[list, list]:
+        # nothing changes until the player reaches another tile
+        tile = (floor(center[0] / TILE_SIZE), floor(center[1] / TILE_SIZE))
+
+        if tile == self.tile:
+            return [], []
+
+        self.tile = tile
+
+        screen = pg.FRect(0, 0, WINDOW_WIDTH, WINDOW_HEIGHT)
+        screen.center = center
+        near = screen.inflate(REGION_BUILD_MARGIN * 2, REGION_BUILD_MARGIN * 2)
+        far = screen.inflate(REGION_RELEASE_MARGIN * 2, REGION_RELEASE_MARGIN * 2)
+
+        build = sorted(
+            key for key in self.grid.query(near)
+            if key not in self.built and self.bounds[key].colliderect(near)
+        )
+        release = [key for key in self.built if not self.bounds[key].colliderect(far)]
+
+        return build, release
@@ -1,6 +1,7 @@
 import pygame as pg
 from pygame.math import Vector2 as vector
-from sys import exit
+from sys import exit, platform
+from os import environ, cpu_count
 from enum import IntEnum
 from pprint import pprint
 
@@ -11,6 +12,63 @@ ANIMATION_SPEED = 6
 BATTLE_OUTLINE_WIDTH = 4
 DEBUG = False
 
+# static layers are baked into square chunks of CHUNK_SIZE tiles
+CHUNK_SIZE = 16
+ANIMATED_CHUNK_SIZE = 8
+# bytes of baked chunks kept, shared by the layers of every built world.
+# grows to what the layers of one world touch during a pan of a screen
+CHUNK_CACHE_BUDGET = 64 * 1024 * 1024
+CHUNK_PREFETCH_MARGIN = TILE_SIZE * 2
+
+# cell size of the spatial index used to cull and query sprites
+SPATIAL_CELL_SIZE = TILE_SIZE * 4
+
+# present only the screen rects that changed while the camera stands still
+DIRTY_RECTS = True
+
+# number of rendered strings kept around by the shared text cache
+TEXT_CACHE_SIZE = 512
+
+# run without a window or sound device, e.g. HEADLESS=1 HEADLESS_FRAMES=600 python main.py
+HEADLESS = environ.get('HEADLESS', '0') == '1'
+HEADLESS_FRAMES = int(environ.get('HEADLESS_FRAMES', '0'))
+
+# bytes of unused monster graphics the asset registry keeps around
+ASSET_CACHE_BUDGET = 32 * 1024 * 1024
+
+# maps closer than this to the player are parsed in the background
+MAP_PREFETCH_DISTANCE = TILE_SIZE * 8
+
+# long tracks streamed as music instead of being decoded up front
+MUSIC_TRACKS = ('overworld', 'battle', 'evolution')
+MUSIC_FADE_MS = 600
+
+# threads decoding assets at startup, 0 decodes everything on the main thread
+ASSET_WORKERS = 0 if platform == 'emscripten' else min(8, cpu_count() or 1)
+
+# derived graphics that are expensive to compute are cached on disk here
+CACHE_DIR = '.cache'
+
+# prebuilt graphics and maps, build it with python -m src.util.bundle
+ASSET_BUNDLE = 'assets.bundle'
+
+# number of built maps kept around so walking back into them is instant
+WORLD_CACHE_SIZE = 3
+
+# milliseconds between wild encounter rolls while walking through a patch
+ENCOUNTER_INTERVAL = 600
+ENCOUNTER_CHANCE = 0.2
+
+# maps are streamed in square regions of REGION_SIZE tiles, regions are
+# built once they come within the build margin of the screen and released
+# once they are further away than the release margin
+REGION_SIZE = 16
+REGION_BUILD_MARGIN = TILE_SIZE * 4
+REGION_RELEASE_MARGIN = TILE_SIZE * 8
+
+# milliseconds per frame spent building a map while the screen is tinted
+SETUP_FRAME_BUDGET = 8
+
 PLAYER = 'player'
 ENEMY = 'enemy'
 
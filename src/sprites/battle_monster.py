@@ -1,13 +1,15 @@
 from src.settings import *
+from src.util.text import render_text
 from random import uniform
 from src.monster import Monster
 from src.util.draw import draw_bar
 from src.util.timer import Timer
-from src.util.imports import import_image
+from src.util.assets import assets
 
 MAIN_RECT_WIDTH = 200
 MAIN_RECT_HEIGHT = 320
 BORDER_WIDTH = 2
+BAR_WIDTH = MAIN_RECT_WIDTH - 16
 
 
 class BattleMonster(pg.sprite.Sprite):
@@ -40,9 +42,15 @@ class BattleMonster(pg.sprite.Sprite):
         self.highlight = False
         self.shine = False
 
-        self.missed_catch_frame = import_image('graphics', 'ui', 'cross')
+        self.missed_catch_frame = assets.get('ui', 'cross')
         self.missed_catch = False
 
+        # pre-rendered panels and the values they were rendered with
+        self.header: pg.Surface | None = None
+        self.header_key: tuple | None = None
+        self.stats: pg.Surface | None = None
+        self.stats_key: tuple | None = None
+
         self.timers = {
             'remove_shine': Timer(250, False, False, self.remove_shine),
             'remove_missed_catch': Timer(600, False, False, lambda: self.set_missed_catch(False))
@@ -95,30 +103,32 @@ class BattleMonster(pg.sprite.Sprite):
             if self.attacked_frame_index > len(self.attack_frames[self.attack_animation]):
                 self.attacked = False
 
-    def draw_name(self) -> pg.FRect:
+    def bar_progress(self, width: float, value: float, max_value: float) -> int:
+        # a bar only looks different once its progress moves a whole pixel
+        return int(max(0, min(width, width / max_value * value)))
+
+    def draw_name(self, surface: pg.Surface) -> pg.FRect:
         # draw name
-        name_surf = self.fonts['regular'].render(
-            self.monster.name, False, COLORS['dark']
+        name_surf = render_text(
+            self.fonts['regular'], self.monster.name, False, COLORS['dark']
         )
         name_rect = name_surf.get_frect()
 
-        name_bg_rect = pg.FRect(
-            (self.main_rect.topleft), (MAIN_RECT_WIDTH, name_rect.height + 3)
-        )
+        name_bg_rect = pg.FRect((0, 0), (MAIN_RECT_WIDTH, name_rect.height + 3))
         name_rect = name_surf.get_rect(center=name_bg_rect.center)
 
         pg.draw.rect(
-            self.screen, COLORS['battle'], name_bg_rect,
+            surface, COLORS['battle'], name_bg_rect,
             border_top_left_radius=5, border_top_right_radius=5
         )
-        self.screen.blit(name_surf, name_rect)
+        surface.blit(name_surf, name_rect)
 
         return name_bg_rect
 
-    def draw_level(self, name_bg_rect: pg.FRect) -> pg.FRect:
+    def draw_level(self, surface: pg.Surface, name_bg_rect: pg.FRect) -> pg.FRect:
         # draw level
-        level_surf = self.fonts['small'].render(
-            f'Level: {self.monster.level}', False, COLORS['dark']
+        level_surf = render_text(
+            self.fonts['small'], f'Level: {self.monster.level}', False, COLORS['dark']
         )
 
         level_rect = level_surf.get_frect()
@@ -130,99 +140,146 @@ class BattleMonster(pg.sprite.Sprite):
         level_rect = level_surf.get_rect(midleft=level_bg_rect.midleft + vector(8, 0))
 
         pg.draw.rect(
-            self.screen, COLORS['battle'], level_bg_rect,
+            surface, COLORS['battle'], level_bg_rect,
             border_bottom_left_radius=5, border_bottom_right_radius=5
         )
 
         draw_bar(
-            self.screen, level_bg_rect, self.monster.xp,
+            surface, level_bg_rect, self.monster.xp,
             self.monster.level_up, COLORS['battle'], COLORS['battle-light'],
             border_bottom_left_radius=5, border_bottom_right_radius=5
         )
-        self.screen.blit(level_surf, level_rect)
+        surface.blit(level_surf, level_rect)
 
         return level_bg_rect
 
-    def draw_health(self, stats_bg_rect: pg.FRect) -> pg.FRect:
-        health_text = self.fonts['small'].render(
+    def get_header_height(self) -> float:
+        name_height = self.fonts['regular'].size(self.monster.name)[1]
+        level_height = self.fonts['small'].size(f'Level: {self.monster.level}')[1]
+
+        return name_height + 3 + level_height + 8
+
+    def render_header(self) -> pg.Surface:
+        surface = pg.Surface((MAIN_RECT_WIDTH, self.get_header_height()), pg.SRCALPHA)
+
+        name_bg_rect = self.draw_name(surface)
+        self.draw_level(surface, name_bg_rect)
+
+        # name & level divider
+        pg.draw.line(
+            surface, COLORS['light'], name_bg_rect.bottomleft, name_bg_rect.bottomright
+        )
+
+        return surface
+
+    def get_header(self) -> pg.Surface:
+        key = (
+            self.monster.level,
+            self.bar_progress(MAIN_RECT_WIDTH, self.monster.xp, self.monster.level_up)
+        )
+
+        if key != self.header_key:
+            self.header = self.render_header()
+            self.header_key = key
+
+        return self.header
+
+    def draw_health(self, surface: pg.Surface, stats_bg_rect: pg.FRect) -> pg.FRect:
+        health_text = render_text(
+            self.fonts['small'],
             f'hp: {int(self.monster.health)}/{self.monster.get_stat('max_health')}',
             False, COLORS['dark']
         )
         health_text_rect = health_text.get_frect(
             topleft=stats_bg_rect.topleft + vector(8, 5)
         )
-        self.screen.blit(health_text, health_text_rect)
+        surface.blit(health_text, health_text_rect)
 
-        health_bar_width = stats_bg_rect.right - health_text_rect.left - 8
         health_bar_rect = pg.FRect(
-            (health_text_rect.bottomleft + vector(0, 2)), (health_bar_width, 5)
+            (health_text_rect.bottomleft + vector(0, 2)), (BAR_WIDTH, 5)
         )
         draw_bar(
-            self.screen, health_bar_rect, self.monster.health,
+            surface, health_bar_rect, self.monster.health,
             self.monster.get_stat('max_health'), COLORS['black'],
             COLORS['red'], border_radius=5
         )
 
         return health_bar_rect
 
-    def draw_energy(self, health_bar_rect: pg.FRect, stats_bg_rect: pg.FRect) -> pg.FRect:
-        energy_text = self.fonts['small'].render(
+    def draw_energy(self, surface: pg.Surface, health_bar_rect: pg.FRect) -> pg.FRect:
+        energy_text = render_text(
+            self.fonts['small'],
             f'ep: {int(self.monster.energy)}/{self.monster.get_stat('max_energy')}',
             False, COLORS['dark']
         )
         energy_text_rect = energy_text.get_frect(
             topleft=health_bar_rect.bottomleft + vector(0, 5)
         )
-        self.screen.blit(energy_text, energy_text_rect)
+        surface.blit(energy_text, energy_text_rect)
 
-        energy_bar_width = stats_bg_rect.right - energy_text_rect.left - 8
         energy_bar_rect = pg.FRect(
-            (energy_text_rect.bottomleft + vector(0, 2)), (energy_bar_width, 5)
+            (energy_text_rect.bottomleft + vector(0, 2)), (BAR_WIDTH, 5)
         )
         draw_bar(
-            self.screen, energy_bar_rect, self.monster.energy,
+            surface, energy_bar_rect, self.monster.energy,
             self.monster.get_stat('max_energy'), COLORS['black'],
             COLORS['blue'], border_radius=5
         )
 
         return energy_bar_rect
 
-    def draw_stats(self, frame_rect: pg.FRect) -> None:
+    def render_stats(self, stats_height: float) -> pg.Surface:
+        surface = pg.Surface((MAIN_RECT_WIDTH, stats_height), pg.SRCALPHA)
+
         # stat rect
-        stats_height = self.main_rect.bottom - frame_rect.bottom
         stats_bg_rect = pg.FRect((0, 0), (MAIN_RECT_WIDTH, stats_height))
-        stats_bg_rect.bottomleft = self.main_rect.bottomleft
-        pg.draw.rect(self.screen, COLORS['battle'], stats_bg_rect, border_radius=5)
+        pg.draw.rect(surface, COLORS['battle'], stats_bg_rect, border_radius=5)
 
         border_rect = stats_bg_rect.copy()
         pg.draw.rect(
-            self.screen, COLORS['dark'], border_rect, BORDER_WIDTH, 5
+            surface, COLORS['dark'], border_rect, BORDER_WIDTH, 5
         )
 
-        health_bar_rect = self.draw_health(stats_bg_rect)
-        energy_bar_rect = self.draw_energy(health_bar_rect, stats_bg_rect)
+        health_bar_rect = self.draw_health(surface, stats_bg_rect)
+        energy_bar_rect = self.draw_energy(surface, health_bar_rect)
 
-        recharge_bar_width = stats_bg_rect.right - energy_bar_rect.left - 8
         recharge_bar_rect = pg.FRect(
-            (energy_bar_rect.bottomleft + vector(0, 3)), (recharge_bar_width, 5)
+            (energy_bar_rect.bottomleft + vector(0, 3)), (BAR_WIDTH, 5)
         )
         draw_bar(
-            self.screen, recharge_bar_rect, self.monster.recharge, MAX_RECHARGE,
+            surface, recharge_bar_rect, self.monster.recharge, MAX_RECHARGE,
             COLORS['white'], COLORS['dark'], border_radius=5
         )
 
-    def draw(self) -> None:
-        name_bg_rect = self.draw_name()
-        level_bg_rect = self.draw_level(name_bg_rect)
+        return surface
 
-        # name & level divider
-        pg.draw.line(
-            self.screen, COLORS['light'], name_bg_rect.bottomleft, name_bg_rect.bottomright
+    def get_stats(self, stats_height: float) -> pg.Surface:
+        max_health = self.monster.get_stat('max_health')
+        max_energy = self.monster.get_stat('max_energy')
+
+        key = (
+            stats_height,
+            int(self.monster.health), max_health,
+            int(self.monster.energy), max_energy,
+            self.bar_progress(BAR_WIDTH, self.monster.health, max_health),
+            self.bar_progress(BAR_WIDTH, self.monster.energy, max_energy),
+            self.bar_progress(BAR_WIDTH, self.monster.recharge, MAX_RECHARGE)
         )
 
+        if key != self.stats_key:
+            self.stats = self.render_stats(stats_height)
+            self.stats_key = key
+
+        return self.stats
+
+    def draw(self) -> None:
+        # name and level panel, only re-rendered when what it shows changes
+        header = self.get_header()
+        header_rect = self.screen.blit(header, self.main_rect.topleft)
+
         # draw frame
         frame = self.frames[self.state][int(self.frame_index)]
-        frame_rect = frame.get_frect(midtop=level_bg_rect.midbottom + vector(0, 2))
+        frame_rect = frame.get_frect(midtop=header_rect.midbottom + vector(0, 2))
 
         if self.highlight:
             outline = self.outlines[self.state][int(self.frame_index)]
@@ -245,7 +302,9 @@ class BattleMonster(pg.sprite.Sprite):
             missed_catch_rect = self.missed_catch_frame.get_rect(center=frame_rect.center)
             self.screen.blit(self.missed_catch_frame, missed_catch_rect)
 
-        self.draw_stats(frame_rect)
+        # stats panel sits between the frame and the bottom of the main rect
+        stats = self.get_stats(self.main_rect.bottom - frame_rect.bottom)
+        self.screen.blit(stats, stats.get_frect(bottomleft=self.main_rect.bottomleft))
 
     def update_timers(self) -> None:
         for timer in self.timers.values():
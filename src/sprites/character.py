@@ -12,6 +12,7 @@ from src.monster import Monster
 
 if TYPE_CHECKING:
     from overlays.dialog import DialogTree
+    from src.groups import CollisionGroup
 
 
 class Character(Entity):
@@ -19,7 +20,7 @@ class Character(Entity):
         self, pos, frames: dict, state: str, character_data: dict,
         radius: float, player: Player, dialog_tree: DialogTree,
         font: pg.Font, shadow: pg.Surface, alert: pg.Surface,
-        collision_group: pg.sprite.Group, notice_sound: pg.mixer.Sound, groups
+        collision_group: CollisionGroup, notice_sound: pg.mixer.Sound, groups
     ) -> None:
         super().__init__(pos, frames, state, shadow, alert, groups, 'character')
 
@@ -45,11 +46,11 @@ class Character(Entity):
             ),
         }
 
-        self.collision_group = pg.sprite.Group()
+        self.collision_group = collision_group
 
-        for sprite in collision_group:
-            if not sprite == self:
-                self.collision_group.add(sprite)
+        # tiles of both ends of the last line of sight check and its result
+        self.sight_tiles: tuple | None = None
+        self.in_sight = False
 
     def get_dialog(self) -> list:
         if self.character_data['defeated']:
@@ -97,20 +98,26 @@ class Character(Entity):
         else:
             self.rect.center += self.direction * speed * dt
             self.hitbox.center = self.rect.center
+            self.collision_group.move(self)
 
     def has_line_of_sight(self) -> bool:
         if vector(self.rect.center).distance_to(self.player.rect.center) >= self.radius:
             return False
 
-        sprite: pg.sprite.Sprite
+        # the occluders never move, so the answer only changes once
+        # either end walked onto another tile
+        sight_tiles = (
+            tuple(vector(self.rect.center) // TILE_SIZE),
+            tuple(vector(self.player.rect.center) // TILE_SIZE)
+        )
 
-        for sprite in self.collision_group:
-            # does the sprite collide with a line from character to player
-            # e.g. character ----------- sprite ------------ player -> TRUE
-            if sprite.rect.clipline(self.rect.center, self.player.rect.center):
-                return False
+        if sight_tiles != self.sight_tiles:
+            self.sight_tiles = sight_tiles
+            self.in_sight = self.collision_group.has_line_of_sight(
+                self.rect.center, self.player.rect.center
+            )
 
-        return True
+        return self.in_sight
 
     def choose_random_state(self) -> None:
         if not self.blocked:
@@ -122,15 +129,17 @@ class Character(Entity):
         for timer in self.timers.values():
             timer.update()
 
-    def draw(self, offset: vector) -> None:
-        self.screen.blit(
+    def draw(self, offset: vector) -> pg.Rect:
+        shadow_rect = self.screen.blit(
             self.shadow, self.rect.topleft + offset + vector(40, 110)
         )
 
-        self.screen.blit(
+        image_rect = self.screen.blit(
             self.image, self.rect.topleft + offset
         )
 
+        return shadow_rect.union(image_rect)
+
     def update(self, dt) -> None:
         self.update_timers()
         self.raycast()
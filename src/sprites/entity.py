@@ -28,8 +28,11 @@ class Entity(pg.sprite.Sprite):
 
         self.blocked = False
 
+        # entities move around so render groups keep re-indexing them
+        self.dynamic = True
+
     @abstractmethod
-    def draw(self, offset: vector) -> None:
+    def draw(self, offset: vector) -> pg.Rect:
         return
 
     def get_state(self):
@@ -6,14 +6,14 @@ from typing import TYPE_CHECKING
 from src.monster import Monster
 
 if TYPE_CHECKING:
-    from textures.texture import Texture
+    from src.groups import CollisionGroup
 
 
 class Player(Entity):
     def __init__(
         self, pos, frames: dict, state: str,
         shadow: pg.Surface, alert: pg.Surface, monsters: list[Monster],
-        collision_group: list[pg.sprite.Sprite], groups
+        collision_group: CollisionGroup, groups
     ) -> None:
         super().__init__(pos, frames, state, shadow, alert, groups, 'player')
 
@@ -61,44 +61,44 @@ class Player(Entity):
         self.vertical_collision()
 
     def horizontal_collision(self) -> bool:
-        sprite: Texture | Entity
-
-        for sprite in self.collision_group:
-            if sprite.hitbox.colliderect(self.hitbox):
+        for hitbox in self.collision_group.hitboxes(self.hitbox):
+            if hitbox.colliderect(self.hitbox):
                 if self.direction.x > 0:
-                    self.hitbox.right = sprite.hitbox.left
+                    self.hitbox.right = hitbox.left
 
                 if self.direction.x < 0:
-                    self.hitbox.left = sprite.hitbox.right
+                    self.hitbox.left = hitbox.right
 
                 self.rect.centerx = self.hitbox.centerx
 
     def vertical_collision(self) -> bool:
-        sprite: Texture | Entity
-
-        for sprite in self.collision_group:
-            if sprite.hitbox.colliderect(self.hitbox):
+        for hitbox in self.collision_group.hitboxes(self.hitbox):
+            if hitbox.colliderect(self.hitbox):
                 if self.direction.y > 0:
-                    self.hitbox.bottom = sprite.hitbox.top
+                    self.hitbox.bottom = hitbox.top
 
                 if self.direction.y < 0:
-                    self.hitbox.top = sprite.hitbox.bottom
+                    self.hitbox.top = hitbox.bottom
 
                 self.rect.centery = self.hitbox.centery
 
-    def draw(self, offset: vector) -> None:
+    def draw(self, offset: vector) -> pg.Rect:
+        rects: list[pg.Rect] = []
+
         if self.alerted:
-            self.screen.blit(
+            rects.append(self.screen.blit(
                 self.alert, self.rect.midtop + offset + vector(-50, -100)
-            )
+            ))
 
-        self.screen.blit(
+        rects.append(self.screen.blit(
             self.shadow, self.rect.topleft + offset + vector(40, 110)
-        )
+        ))
 
-        self.screen.blit(
+        rects.append(self.screen.blit(
             self.image, self.rect.topleft + offset
-        )
+        ))
+
+        return rects[0].unionall(rects[1:])
 
     def update(self, dt: float) -> None:
         if not self.blocked:
@@ -0,0 +1,68 @@
+from src.settings import *
+from pygame import Surface
+from src.textures.chunk_layer import ChunkLayer, ChunkCache, chunk_cache
+from math import lcm
+
+
+class AnimatedChunkLayer(ChunkLayer):
+    def __init__(
+        self, chunk_size: int = ANIMATED_CHUNK_SIZE, cache: ChunkCache = chunk_cache
+    ) -> None:
+        super().__init__(chunk_size, cache)
+
+        # one clock drives every tile, a chunk bakes one surface per frame
+        self.frame_index = 0
+        self.frame_count = 1
+        self.drawn_frame: int | None = None
+
+    def add(self, pos: tuple[float, float], frames: list[Surface]) -> None:
+        if len(frames) == 0:
+            raise Exception('Frames array needed.')
+
+        rect = frames[0].get_frect(topleft=pos)
+
+        for key in self.chunk_keys(rect):
+            self.tiles.setdefault(key, []).append((pos, frames))
+
+        self.frame_count = lcm(self.frame_count, len(frames))
+
+    def bake(self, key: tuple[int, int]) -> list[Surface]:
+        tiles = self.tiles[key]
+        frame_count = lcm(*(len(frames) for _, frames in tiles))
+        origin = self.chunk_pos(key)
+        chunk: list[Surface] = []
+
+        for index in range(frame_count):
+            surf = Surface((self.chunk_pixels, self.chunk_pixels), pg.SRCALPHA)
+
+            for pos, frames in tiles:
+                surf.blit(frames[index % len(frames)], pos - origin)
+
+            chunk.append(surf)
+
+        return chunk
+
+    def chunk_frames(self) -> int:
+        # every chunk frame count divides the layer frame count
+        return self.frame_count
+
+    def measure(self, chunk: list[Surface]) -> int:
+        return sum(ChunkLayer.measure(self, surf) for surf in chunk)
+
+    def update(self, dt: float) -> None:
+        self.frame_index += ANIMATION_SPEED * dt
+        self.frame_index %= self.frame_count
+
+    def get_surface(self, key: tuple[int, int]) -> Surface:
+        chunk = self.get_chunk(key)
+
+        # every chunk frame count divides the layer frame count
+        return chunk[int(self.frame_index) % len(chunk)]
+
+    def changed_rects(self, rects: list[pg.Rect]) -> list[pg.Rect]:
+        if self.drawn_frame == int(self.frame_index):
+            return []
+
+        self.drawn_frame = int(self.frame_index)
+
+        return rects
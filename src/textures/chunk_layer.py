@@ -0,0 +1,170 @@
+from src.settings import *
+from pygame import Surface
+from collections import OrderedDict
+from math import floor
+from typing import Any, Iterator
+
+
+class ChunkCache:
+    def __init__(self, budget: int = CHUNK_CACHE_BUDGET) -> None:
+        self.budget = budget
+
+        # baked chunks of every layer, least recently drawn first, so the
+        # layers of worlds kept around give memory back to the one on screen
+        self.chunks: OrderedDict[tuple[ChunkLayer, tuple[int, int]], Any] = OrderedDict()
+        self.sizes: dict[tuple[ChunkLayer, tuple[int, int]], int] = {}
+        self.size = 0
+
+    def __contains__(self, key: tuple) -> bool:
+        return key in self.chunks
+
+    def get(self, key: tuple):
+        self.chunks.move_to_end(key)
+
+        return self.chunks[key]
+
+    def add(self, key: tuple, chunk, size: int) -> None:
+        self.chunks[key] = chunk
+        self.sizes[key] = size
+        self.size += size
+
+    def remove(self, key: tuple) -> None:
+        del self.chunks[key]
+        self.size -= self.sizes.pop(key)
+
+    def evict(self, keep: set[tuple]) -> None:
+        # drop least recently drawn chunks until we are back under budget
+        while self.size > self.budget:
+            key = next(iter(self.chunks))
+
+            if key in keep:
+                return
+
+            self.remove(key)
+
+    def fit(self, size: int) -> None:
+        # never smaller than what the layers of one world need at once
+        self.budget = max(self.budget, size)
+
+    def forget(self, layer: 'ChunkLayer') -> None:
+        for key in [key for key in self.chunks if key[0] is layer]:
+            self.remove(key)
+
+
+chunk_cache = ChunkCache()
+
+
+class ChunkLayer:
+    def __init__(self, chunk_size: int = CHUNK_SIZE, cache: ChunkCache = chunk_cache) -> None:
+        self.screen = pg.display.get_surface()
+        self.chunk_pixels = chunk_size * TILE_SIZE
+        self.cache = cache
+
+        # tiles waiting to be baked, kept in the order they were added
+        self.tiles: dict[tuple[int, int], list[tuple[tuple[float, float], Surface]]] = {}
+
+        # chunks drawn or baked last frame, never evicted
+        self.visible: list[tuple[int, int]] = []
+
+    def add(self, pos: tuple[float, float], surf: Surface) -> None:
+        rect = surf.get_frect(topleft=pos)
+
+        # a tile bigger than a cell can spill into the next chunk
+        for key in self.chunk_keys(rect):
+            self.tiles.setdefault(key, []).append((pos, surf))
+
+    def chunk_keys(self, rect: pg.FRect) -> list[tuple[int, int]]:
+        left = floor(rect.left / self.chunk_pixels)
+        top = floor(rect.top / self.chunk_pixels)
+        right = floor((rect.right - 1) / self.chunk_pixels)
+        bottom = floor((rect.bottom - 1) / self.chunk_pixels)
+
+        return [
+            (x, y) for y in range(top, bottom + 1) for x in range(left, right + 1)
+        ]
+
+    def working_set(self) -> int:
+        # bytes of the chunks a camera touches while it pans by a whole
+        # screen, including the chunk baked ahead of it
+        columns = (WINDOW_WIDTH * 2 + CHUNK_PREFETCH_MARGIN * 2) // self.chunk_pixels + 2
+        rows = (WINDOW_HEIGHT + CHUNK_PREFETCH_MARGIN * 2) // self.chunk_pixels + 2
+
+        return columns * rows * self.chunk_pixels ** 2 * 4 * self.chunk_frames()
+
+    def chunk_frames(self) -> int:
+        return 1
+
+    def chunk_pos(self, key: tuple[int, int]) -> vector:
+        return vector(key) * self.chunk_pixels
+
+    def bake(self, key: tuple[int, int]) -> Surface:
+        surf = Surface((self.chunk_pixels, self.chunk_pixels), pg.SRCALPHA)
+        origin = self.chunk_pos(key)
+
+        for pos, tile in self.tiles[key]:
+            surf.blit(tile, pos - origin)
+
+        return surf
+
+    def bake_visible(self, center: vector) -> Iterator[None]:
+        # bakes what a camera centered here shows, one chunk per step
+        camera = pg.FRect(0, 0, WINDOW_WIDTH, WINDOW_HEIGHT)
+        camera.center = center
+
+        for key in self.chunk_keys(camera):
+            if key in self.tiles and (self, key) not in self.cache:
+                self.get_chunk(key)
+                yield
+
+    def get_chunk(self, key: tuple[int, int]) -> Surface:
+        if (self, key) in self.cache:
+            return self.cache.get((self, key))
+
+        chunk = self.bake(key)
+        self.cache.add((self, key), chunk, self.measure(chunk))
+
+        return chunk
+
+    def measure(self, chunk: Surface) -> int:
+        return chunk.get_width() * chunk.get_height() * chunk.get_bytesize()
+
+    def empty(self) -> None:
+        self.tiles.clear()
+        self.visible.clear()
+        self.cache.forget(self)
+
+    def update(self, dt: float) -> None:
+        return
+
+    def get_surface(self, key: tuple[int, int]) -> Surface:
+        return self.get_chunk(key)
+
+    def draw(self, offset: vector) -> list[pg.Rect]:
+        camera = pg.FRect(-offset.x, -offset.y, WINDOW_WIDTH, WINDOW_HEIGHT)
+
+        visible = [key for key in self.chunk_keys(camera) if key in self.tiles]
+        rects: list[pg.Rect] = []
+
+        for key in visible:
+            # floor so chunks line up with sprites blitted at positive coords
+            pos = self.chunk_pos(key) + offset
+            rects.append(
+                self.screen.blit(self.get_surface(key), (floor(pos.x), floor(pos.y)))
+            )
+
+        # bake at most one chunk ahead of the camera per frame
+        nearby = camera.inflate(CHUNK_PREFETCH_MARGIN * 2, CHUNK_PREFETCH_MARGIN * 2)
+
+        for key in self.chunk_keys(nearby):
+            if key in self.tiles and (self, key) not in self.cache:
+                self.get_chunk(key)
+                visible.append(key)
+                break
+
+        self.visible = visible
+
+        return self.changed_rects(rects)
+
+    def changed_rects(self, rects: list[pg.Rect]) -> list[pg.Rect]:
+        # static chunks look the same every frame
+        return []
@@ -10,11 +10,12 @@ class Texture(pg.sprite.Sprite):
         self.rect = self.image.get_frect(topleft=pos)
         self.z = z
         self.hitbox = self.rect.copy()
+        self.dynamic = False
 
     def get_y_sort(self) -> float:
         return self.rect.centery
 
-    def draw(self, offset: vector) -> None:
-        self.screen.blit(
+    def draw(self, offset: vector) -> pg.Rect:
+        return self.screen.blit(
             self.image, self.rect.topleft + offset
         )
@@ -0,0 +1,146 @@
+from src.settings import *
+from src.util.imports import import_image, import_monster
+from src.util.outline_cache import import_outlines
+from src.util.support import flip_surfaces
+from collections import OrderedDict
+from typing import Any, Callable
+
+
+def measure(asset) -> int:
+    if isinstance(asset, pg.Surface):
+        return asset.get_width() * asset.get_height() * asset.get_bytesize()
+
+    if isinstance(asset, dict):
+        return sum(measure(value) for value in asset.values())
+
+    if isinstance(asset, (list, tuple)):
+        return sum(measure(value) for value in asset)
+
+    return 0
+
+
+class AssetCategory:
+    # lets code index a category like the dicts the loaders return
+    def __init__(self, registry: 'AssetRegistry', category: str) -> None:
+        self.registry = registry
+        self.category = category
+
+    def __getitem__(self, name: str | tuple):
+        return self.registry.get(self.category, name)
+
+
+class AssetRegistry:
+    def __init__(self, budget: int = ASSET_CACHE_BUDGET) -> None:
+        self.budget = budget
+        self.loaders: dict[str, Callable[[str], Any]] = {}
+
+        # least recently used assets come first
+        self.assets: OrderedDict[tuple, Any] = OrderedDict()
+        self.sizes: dict[tuple, int] = {}
+        self.refs: dict[tuple, int] = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    def register(self, category: str, loader: Callable[[str], Any]) -> None:
+        self.loaders[category] = loader
+
+        # whatever the old loader produced is stale now
+        for key in [key for key in self.assets if key[0] == category]:
+            self.forget(key)
+
+    def category(self, category: str) -> AssetCategory:
+        return AssetCategory(self, category)
+
+    def get(self, category: str, name: str | tuple):
+        key = (category, name)
+
+        if key in self.assets:
+            self.hits += 1
+            self.assets.move_to_end(key)
+            return self.assets[key]
+
+        self.misses += 1
+        asset = self.loaders[category](name)
+        self.assets[key] = asset
+        self.sizes[key] = measure(asset)
+        self.evict()
+
+        return asset
+
+    def acquire(self, category: str, name: str | tuple):
+        # acquired assets stay loaded until every acquire was released
+        key = (category, name)
+        self.refs[key] = self.refs.get(key, 0) + 1
+
+        return self.get(category, name)
+
+    def release(self, category: str, name: str | tuple) -> None:
+        key = (category, name)
+        self.refs[key] -= 1
+
+        if not self.refs[key]:
+            del self.refs[key]
+            self.evict()
+
+    def forget(self, key: tuple) -> None:
+        del self.assets[key]
+        del self.sizes[key]
+
+    def resident_bytes(self) -> int:
+        return sum(self.sizes.values())
+
+    def evict(self) -> None:
+        resident = self.resident_bytes()
+
+        for key in list(self.assets):
+            if resident <= self.budget:
+                break
+
+            if key not in self.refs:
+                resident -= self.sizes[key]
+                self.forget(key)
+
+    def get_stats(self) -> dict[str, int]:
+        stats = dict.fromkeys(self.loaders, 0)
+
+        for (category, _), size in self.sizes.items():
+            stats[category] += size
+
+        return stats
+
+    def clear(self) -> None:
+        self.assets.clear()
+        self.sizes.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+assets = AssetRegistry()
+
+
+def import_mirrored(key: tuple[str, str]) -> dict[str, list[pg.Surface]]:
+    # (category, species), the player side of a battle faces the other way
+    category, name = key
+    state_frames = assets.get(category, name)
+
+    return {state: flip_surfaces(frames, True, False) for state, frames in state_frames.items()}
+
+
+def import_evolution(name: str) -> dict[str, pg.Surface]:
+    frame = pg.transform.scale2x(assets.get('monsters', name)['idle'][0])
+    silhouette = pg.mask.from_surface(frame).to_surface()
+    silhouette.set_colorkey('black')
+
+    return {'frame': frame, 'silhouette': silhouette}
+
+
+assets.register('icons', lambda name: import_image('graphics', 'icons', name))
+assets.register('monsters', lambda name: import_monster(4, 2, 'graphics', 'monsters', name))
+assets.register(
+    'outlines',
+    lambda name: import_outlines(name, assets.get('monsters', name), BATTLE_OUTLINE_WIDTH)
+)
+assets.register('mirrored', import_mirrored)
+assets.register('ui', lambda name: import_image('graphics', 'ui', name))
+assets.register('evolution', import_evolution)
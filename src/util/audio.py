@@ -0,0 +1,70 @@
+from src.settings import *
+
+
+class SilentSound:
+    # stands in for pg.mixer.Sound when there is no sound device to play on
+    def __init__(self) -> None:
+        self.volume = 1.0
+
+    def play(self, loops: int = 0, maxtime: int = 0, fade_ms: int = 0) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+    def fadeout(self, time: int) -> None:
+        pass
+
+    def set_volume(self, value: float) -> None:
+        self.volume = value
+
+    def get_volume(self) -> float:
+        return self.volume
+
+    def get_length(self) -> float:
+        return 0.0
+
+
+class Music:
+    # long tracks are streamed from disk on the mixer's music channel
+    def __init__(self, tracks: dict[str, str], volume: float) -> None:
+        self.tracks = tracks
+        self.track: str | None = None
+
+        # the streamed music has a single channel, so there is no real
+        # crossfade. the next track waits here for the current one to fade
+        # out and then fades in over the same time
+        self.pending: tuple[str, int] | None = None
+
+        if not HEADLESS:
+            pg.mixer.music.set_volume(volume)
+
+    def play(self, name: str, loops: int = -1) -> None:
+        if HEADLESS or name == self.track and (self.pending or pg.mixer.music.get_busy()):
+            return
+
+        self.track = name
+
+        if pg.mixer.music.get_busy():
+            self.pending = (name, loops)
+            pg.mixer.music.fadeout(MUSIC_FADE_MS)
+        else:
+            self.start(name, loops)
+
+    def start(self, name: str, loops: int) -> None:
+        self.pending = None
+        pg.mixer.music.load(self.tracks[name])
+        pg.mixer.music.play(loops, fade_ms=MUSIC_FADE_MS)
+
+    def stop(self) -> None:
+        if self.track is None or HEADLESS:
+            return
+
+        self.track = None
+        self.pending = None
+        pg.mixer.music.fadeout(MUSIC_FADE_MS)
+
+    def update(self) -> None:
+        # the fade out is over, fade the waiting track in
+        if self.pending and not pg.mixer.music.get_busy():
+            self.start(*self.pending)
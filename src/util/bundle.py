@@ -0,0 +1,151 @@
+from src.settings import *
+from os.path import join, exists
+from os import walk, stat
+from pytmx import TiledElement
+from hashlib import sha1
+from io import BytesIO
+import mmap
+import pickle
+import struct
+
+BUNDLE_MAGIC = b'MQAB'
+# bump whenever the loaders change what they produce
+BUNDLE_VERSION = 3
+BUNDLE_SOURCES = ('graphics', join('data', 'maps'))
+
+# magic, version, source fingerprint, index size
+HEADER = struct.Struct('<4sI20sQ')
+
+
+def source_fingerprint() -> bytes:
+    digest = sha1(str(BATTLE_OUTLINE_WIDTH).encode())
+
+    for source in BUNDLE_SOURCES:
+        for folder_path, _, file_names in sorted(walk(source)):
+            for file_name in sorted(file_names):
+                path = join(folder_path, file_name)
+                info = stat(path)
+                digest.update(f'{path}:{info.st_size}:{info.st_mtime_ns};'.encode())
+
+    return digest.digest()
+
+
+def new_element(cls: type) -> TiledElement:
+    return cls.__new__(cls)
+
+
+def set_element_state(element: TiledElement, state: dict) -> None:
+    element.__dict__.update(state)
+
+
+class BundleWriter(pickle.Pickler):
+    def __init__(self, file: BytesIO) -> None:
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self.pixels = bytearray()
+
+        # maps share tilesets, identical pixels are only stored once
+        self.offsets: dict[tuple, int] = {}
+
+    def persistent_id(self, obj) -> tuple | None:
+        if not isinstance(obj, pg.Surface):
+            return None
+
+        pixels = pg.image.tobytes(obj, 'BGRA')
+        key = (obj.get_size(), sha1(pixels).digest())
+
+        if key not in self.offsets:
+            # keep pixel rows 4 byte aligned like sdl does
+            self.pixels.extend(bytes(-len(self.pixels) % 4))
+            self.offsets[key] = len(self.pixels)
+            self.pixels.extend(pixels)
+
+        return (self.offsets[key], obj.get_size(), obj.get_colorkey())
+
+    def reducer_override(self, obj):
+        # pytmx looks up missing attributes in the element properties
+        # which recurses forever while the default unpickler restores them
+        if isinstance(obj, TiledElement):
+            # object groups are lists of their objects
+            items = iter(obj) if isinstance(obj, list) else None
+
+            return new_element, (type(obj),), obj.__dict__, items, None, set_element_state
+
+        return NotImplemented
+
+
+class BundleReader(pickle.Unpickler):
+    def __init__(self, file: BytesIO, pixels: memoryview) -> None:
+        super().__init__(file)
+        self.pixels = pixels
+        self.surfaces: dict[tuple, pg.Surface] = {}
+
+    def persistent_load(self, pid: tuple) -> pg.Surface:
+        if pid not in self.surfaces:
+            offset, size, colorkey = pid
+            width, height = size
+            buffer = self.pixels[offset:offset + width * height * 4]
+
+            # the surface draws straight from the mapped file
+            surf = pg.image.frombuffer(buffer, size, 'BGRA')
+
+            if colorkey:
+                surf.set_colorkey(colorkey)
+
+            self.surfaces[pid] = surf
+
+        return self.surfaces[pid]
+
+
+def build_bundle(graphics: dict, path: str = ASSET_BUNDLE) -> None:
+    index = BytesIO()
+    writer = BundleWriter(index)
+    writer.dump(graphics)
+
+    with open(path, 'wb') as file:
+        file.write(HEADER.pack(
+            BUNDLE_MAGIC, BUNDLE_VERSION, source_fingerprint(), len(index.getbuffer())
+        ))
+        file.write(index.getbuffer())
+        file.write(writer.pixels)
+
+
+def load_bundle(path: str = ASSET_BUNDLE) -> dict | None:
+    if not exists(path):
+        return None
+
+    with open(path, 'rb') as file:
+        try:
+            # private copy on write mapping, pages are only read when drawn
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+        except (OSError, ValueError):
+            data = bytearray(file.read())
+
+    magic, version, fingerprint, index_size = HEADER.unpack_from(data)
+
+    if magic != BUNDLE_MAGIC or version != BUNDLE_VERSION or \
+            fingerprint != source_fingerprint():
+        if DEBUG:
+            print(f'{path} is out of date, rebuild it with python -m src.util.bundle')
+
+        return None
+
+    view = memoryview(data)
+    index = view[HEADER.size:HEADER.size + index_size]
+    reader = BundleReader(BytesIO(index), view[HEADER.size + index_size:])
+
+    return reader.load()
+
+
+if __name__ == '__main__':
+    # pickle has to find the helpers under their module name, not __main__,
+    # so the bundle is built by the imported module rather than this one
+    from src.util import bundle
+    from src.util.imports import import_bundle_graphics
+
+    # surfaces are converted to the display format, no window needed for that
+    environ['SDL_VIDEODRIVER'] = 'dummy'
+    pg.init()
+    pg.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+    bundle.build_bundle(import_bundle_graphics())
+    print(f'wrote {ASSET_BUNDLE}')
@@ -0,0 +1,113 @@
+from src.settings import *
+from math import floor, ceil, inf
+
+
+class CollisionGrid:
+    def __init__(self, size: tuple[int, int] = (0, 0), tile_size: int = TILE_SIZE) -> None:
+        self.width, self.height = size
+        self.tile_size = tile_size
+
+        # one byte per tile, set when a static collider touches the tile
+        self.blocked = bytearray(self.width * self.height)
+
+        # the colliders are not tile aligned, so every touched tile keeps
+        # the exact rects touching it as keys into rects
+        self.rects: dict[int, pg.FRect] = {}
+        self.tile_rects: dict[int, list[int]] = {}
+        self.next_index = 0
+
+    def tile_range(self, rect: pg.FRect) -> tuple[int, int, int, int]:
+        # rects hanging over the map edge belong to the edge tiles
+        left = min(max(floor(rect.left / self.tile_size), 0), self.width - 1)
+        top = min(max(floor(rect.top / self.tile_size), 0), self.height - 1)
+        right = min(max(ceil(rect.right / self.tile_size) - 1, left), self.width - 1)
+        bottom = min(max(ceil(rect.bottom / self.tile_size) - 1, top), self.height - 1)
+
+        return left, top, right, bottom
+
+    def add(self, rect: pg.FRect) -> int:
+        left, top, right, bottom = self.tile_range(rect)
+        index = self.next_index
+        self.rects[index] = rect
+        self.next_index += 1
+
+        for y in range(top, bottom + 1):
+            for x in range(left, right + 1):
+                tile = y * self.width + x
+                self.blocked[tile] = 1
+                self.tile_rects.setdefault(tile, []).append(index)
+
+        return index
+
+    def remove(self, index: int) -> None:
+        left, top, right, bottom = self.tile_range(self.rects.pop(index))
+
+        for y in range(top, bottom + 1):
+            for x in range(left, right + 1):
+                tile = y * self.width + x
+                self.tile_rects[tile].remove(index)
+
+                if not self.tile_rects[tile]:
+                    del self.tile_rects[tile]
+                    self.blocked[tile] = 0
+
+    def is_blocked(self, x: int, y: int) -> bool:
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return bool(self.blocked[y * self.width + x])
+
+        return False
+
+    def query(self, rect: pg.FRect) -> list[pg.FRect]:
+        if not self.rects:
+            return []
+
+        left, top, right, bottom = self.tile_range(rect)
+        found: set[int] = set()
+
+        for y in range(top, bottom + 1):
+            row = y * self.width
+
+            for x in range(left, right + 1):
+                if self.blocked[row + x]:
+                    found.update(self.tile_rects[row + x])
+
+        # in the order they were added, like the sprites they replace
+        return [self.rects[index] for index in sorted(found)]
+
+    def line_of_sight(self, start: tuple[float, float], end: tuple[float, float]) -> bool:
+        # amanatides and woo, visit every tile the line passes through in
+        # order and only clip the line against rects on marked tiles
+        x, y = floor(start[0] / self.tile_size), floor(start[1] / self.tile_size)
+        end_x, end_y = floor(end[0] / self.tile_size), floor(end[1] / self.tile_size)
+        dx, dy = end[0] - start[0], end[1] - start[1]
+
+        step_x = 1 if dx > 0 else -1
+        step_y = 1 if dy > 0 else -1
+
+        # how far along the line, from 0 to 1, the next tile border is
+        # and how far apart the borders are
+        next_x = ((x + (dx > 0)) * self.tile_size - start[0]) / dx if dx else inf
+        next_y = ((y + (dy > 0)) * self.tile_size - start[1]) / dy if dy else inf
+        delta_x = self.tile_size / abs(dx) if dx else inf
+        delta_y = self.tile_size / abs(dy) if dy else inf
+
+        tested: set[int] = set()
+
+        while True:
+            if self.is_blocked(x, y):
+                for index in self.tile_rects[y * self.width + x]:
+                    if index not in tested:
+                        tested.add(index)
+
+                        if self.rects[index].clipline(start, end):
+                            return False
+
+            if (x, y) == (end_x, end_y) or min(next_x, next_y) > 1:
+                return True
+
+            if next_x < next_y:
+                next_x += delta_x
+                x += step_x
+            else:
+                next_y += delta_y
+                y += step_y
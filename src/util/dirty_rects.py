@@ -0,0 +1,48 @@
+from src.settings import *
+
+
+class DirtyRects:
+    def __init__(self) -> None:
+        self.rects: list[pg.Rect] = []
+
+        # the very first frame has to be presented as a whole
+        self.full = True
+
+    def add(self, rect: pg.Rect | pg.FRect) -> None:
+        self.rects.append(pg.Rect(rect))
+
+    def extend(self, rects: list[pg.Rect]) -> None:
+        for rect in rects:
+            self.add(rect)
+
+    def invalidate(self) -> None:
+        self.full = True
+
+    def merge(self) -> list[pg.Rect]:
+        merged: list[pg.Rect] = []
+
+        # grow each rect with everything it overlaps so no pixel is sent twice
+        for rect in self.rects:
+            index = rect.collidelist(merged)
+
+            while index != -1:
+                rect.union_ip(merged.pop(index))
+                index = rect.collidelist(merged)
+
+            merged.append(rect)
+
+        return merged
+
+    def present(self) -> None:
+        # there is no window to present to in headless mode
+        if HEADLESS:
+            self.rects.clear()
+            return
+
+        if self.full or not DIRTY_RECTS:
+            pg.display.update()
+        elif self.rects:
+            pg.display.update(self.merge())
+
+        self.rects.clear()
+        self.full = False
@@ -1,16 +1,53 @@
 from src.settings import *
-from os.path import join
+from os.path import join, isdir
 from os import walk
 from pytmx.util_pygame import load_pygame
+from src.util.audio import SilentSound, Music
+from src.util.support import calculate_monster_outlines, scale_visible
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+# images decoded ahead of time by decode_images, waiting to be imported
+decoded: dict[str, pg.Surface] = {}
+
+
+def load_parallel(load: Callable, paths: list[str]) -> list:
+    # results come back in the order of paths no matter which worker finished first
+    if not ASSET_WORKERS:
+        return [load(path) for path in paths]
+
+    with ThreadPoolExecutor(ASSET_WORKERS) as pool:
+        return list(pool.map(load, paths))
+
+
+def decode_images(*full_paths: str) -> None:
+    paths = []
+
+    for full_path in full_paths:
+        if not isdir(full_path):
+            paths.append(full_path)
+            continue
+
+        for folder_path, _, image_names in walk(full_path):
+            paths.extend(join(folder_path, name) for name in sorted(image_names))
+
+    decoded.update(zip(paths, load_parallel(pg.image.load, paths)))
+
+
+def load_image(full_path: str) -> pg.Surface:
+    # converting stays on the main thread, only decoding is fanned out
+    surf = decoded.pop(full_path, None)
+
+    return pg.image.load(full_path) if surf is None else surf
 
 
 def import_image(*path, alpha=True, format='png') -> pg.Surface:
     full_path = join(*path) + f'.{format}'
 
     if (alpha):
-        surf = pg.image.load(full_path).convert_alpha()
+        surf = load_image(full_path).convert_alpha()
     else:
-        surf = pg.image.load(full_path).convert()
+        surf = load_image(full_path).convert()
 
     return surf
 
@@ -20,7 +57,7 @@ def import_folder(*path):
     for folder_path, sub_folders, image_names in walk(join(*path)):
         for image_name in sorted(image_names, key=lambda name: int(name.split('.')[0])):
             full_path = join(folder_path, image_name)
-            surf = pg.image.load(full_path).convert_alpha()
+            surf = load_image(full_path).convert_alpha()
             frames.append(surf)
 
     return frames
@@ -31,7 +68,7 @@ def import_folder_dict(*path) -> dict[str, pg.Surface]:
     for folder_path, sub_folders, image_names in walk(join(*path)):
         for image_name in image_names:
             full_path = join(folder_path, image_name)
-            surf = pg.image.load(full_path).convert_alpha()
+            surf = load_image(full_path).convert_alpha()
             frames[image_name.split('.')[0]] = surf
 
     return frames
@@ -49,25 +86,33 @@ def import_sub_folders(*path):
     return frames
 
 
+def import_star_frames(*path) -> list[tuple[pg.Surface, tuple[int, int]]]:
+    # scaled once, the evolution only blits them. each frame comes with
+    # where its visible part sits relative to the centered scaled frame
+    frames = []
+
+    for frame in import_folder(*path):
+        scaled_frame, visible_rect = scale_visible(frame)
+        width, height = frame.get_size()
+        frames.append((scaled_frame, (visible_rect.left - width, visible_rect.top - height)))
+
+    return frames
+
+
 def import_tilemap(cols, rows, *path) -> dict:
     frames = {}
     surf = import_image(*path)
 
-    cell_width = surf.get_width() / cols
-    cell_height = surf.get_height() / rows
+    cell_width = surf.get_width() // cols
+    cell_height = surf.get_height() // rows
 
     for col in range(cols):
         for row in range(rows):
-            cutout_rect = pg.FRect(
+            cutout_rect = pg.Rect(
                 col * cell_width, row * cell_height, cell_width, cell_height
             )
-            cutout_surf = pg.Surface((cell_width, cell_height)).convert_alpha()
-            # fill bg with color we dont use
-            cutout_surf.fill('green')
-            # ignore that color
-            cutout_surf.set_colorkey('green')
-            cutout_surf.blit(surf, (0, 0), cutout_rect)
-            frames[(col, row)] = cutout_surf
+            # cells are views into the sheet and share its pixels
+            frames[(col, row)] = surf.subsurface(cutout_rect)
 
     return frames
 
@@ -147,16 +192,28 @@ def import_coast(cols, rows, *path) -> dict:
 
 
 def import_tmx_maps(*path) -> dict:
-    tmx_dict = {}
+    names = []
+    paths = []
 
     for folder_path, _, file_names in walk(join(*path)):
         file_name: str
         for file_name in file_names:
-            tmx_dict[file_name.split('.')[0]] = load_pygame(
-                join(folder_path, file_name)
-            )
+            names.append(file_name.split('.')[0])
+            paths.append(join(folder_path, file_name))
 
-    return tmx_dict
+    return dict(zip(names, load_parallel(load_pygame, paths)))
+
+
+def import_monster(cols, rows, *path) -> dict[str, list[pg.Surface]]:
+    frame_dict = import_tilemap(cols, rows, *path)
+    frames = {}
+
+    for row, state in enumerate(('idle', 'attack')):
+        frames[state] = []
+        for col in range(cols):
+            frames[state].append(frame_dict[(col, row)])
+
+    return frames
 
 
 def import_monster_frames(cols, rows, *path) -> dict:
@@ -167,30 +224,78 @@ def import_monster_frames(cols, rows, *path) -> dict:
 
         for image_name in image_names:
             image_name = image_name.split('.')[0]
-            frame_dict = import_tilemap(cols, rows, *path, image_name)
-            monster_frames[image_name] = {}
-
-            for row, state in enumerate(('idle', 'attack')):
-                monster_frames[image_name][state] = []
-                for col in range(cols):
-                    monster_frames[image_name][state].append(
-                        frame_dict[(col, row)]
-                    )
+            monster_frames[image_name] = import_monster(cols, rows, *path, image_name)
 
     return monster_frames
 
 
 def import_audio(*path) -> dict[str, pg.mixer.Sound]:
     audio: dict[str, pg.mixer.Sound] = {}
+    audio_names: list[str] = []
+
+    for _, _, file_names in walk(join(*path)):
+        # music is streamed, see import_music
+        audio_names.extend(
+            name for name in file_names if name.split('.')[0] not in MUSIC_TRACKS
+        )
+
+    if HEADLESS:
+        return {audio_name.split('.')[0]: SilentSound() for audio_name in audio_names}
 
-    for _, _, audio_names in walk(join(*path)):
-        audio_name: str
+    paths = [join(*path, audio_name) for audio_name in audio_names]
 
-        for audio_name in audio_names:
-            normalized_name = audio_name.split('.')[0]
-            audio[normalized_name] = pg.mixer.Sound(join(*path, audio_name))
+    for audio_name, sound in zip(audio_names, load_parallel(pg.mixer.Sound, paths)):
+        normalized_name = audio_name.split('.')[0]
+        audio[normalized_name] = sound
 
-            volume = 0.1 if DEBUG else 0.4
-            audio[normalized_name].set_volume(volume)
+        volume = 0.1 if DEBUG else 0.4
+        audio[normalized_name].set_volume(volume)
 
     return audio
+
+
+def import_music(*path) -> Music:
+    tracks: dict[str, str] = {}
+
+    for _, _, file_names in walk(join(*path)):
+        file_name: str
+
+        for file_name in file_names:
+            if file_name.split('.')[0] in MUSIC_TRACKS:
+                tracks[file_name.split('.')[0]] = join(*path, file_name)
+
+    return Music(tracks, 0.1 if DEBUG else 0.4)
+
+
+def import_graphics() -> dict:
+    decode_images(
+        join('graphics', 'tilesets', 'water'), join('graphics', 'tilesets', 'coast.png'),
+        join('graphics', 'characters'), join('graphics', 'ui'), join('graphics', 'backgrounds'),
+        join('graphics', 'attacks'), join('graphics', 'other', 'star-animation')
+    )
+
+    # maps and monster graphics are loaded when they are first needed
+    return {
+        'overworld_frames': {
+            'water': import_folder('graphics', 'tilesets', 'water'),
+            'coast': import_coast(24, 12, 'graphics', 'tilesets', 'coast'),
+            'characters': import_characters(4, 4, 'graphics', 'characters')
+        },
+        'ui_icons': import_folder_dict('graphics', 'ui'),
+        'battle_backgrounds': import_folder_dict('graphics', 'backgrounds'),
+        'attack_frames': import_attacks(4, 1, 'graphics', 'attacks'),
+        'star_frames': import_star_frames('graphics', 'other', 'star-animation'),
+    }
+
+
+def import_bundle_graphics() -> dict:
+    # everything the asset bundle holds, see src/util/bundle.py
+    graphics = import_graphics()
+    graphics['tmx_maps'] = import_tmx_maps('data', 'maps')
+    graphics['monsters'] = import_monster_frames(4, 2, 'graphics', 'monsters')
+    graphics['outlines'] = calculate_monster_outlines(
+        graphics['monsters'], BATTLE_OUTLINE_WIDTH
+    )
+    graphics['icons'] = import_folder_dict('graphics', 'icons')
+
+    return graphics
@@ -0,0 +1,85 @@
+from src.settings import *
+from src.util.support import calculate_monster_outlines
+from os.path import join, exists
+from os import makedirs, replace
+from hashlib import sha1
+import struct
+
+# frame width, frame height, frames per state
+HEADER = struct.Struct('<HHH')
+STATES = ('idle', 'attack')
+
+
+def outline_cache_path(name: str, width: int) -> str:
+    with open(join('graphics', 'monsters', f'{name}.png'), 'rb') as file:
+        digest = sha1(file.read())
+
+    digest.update(f':{width}'.encode())
+
+    return join(CACHE_DIR, 'outlines', f'{digest.hexdigest()}.bin')
+
+
+def load_outlines(path: str) -> dict[str, list[pg.Surface]] | None:
+    if not exists(path):
+        return None
+
+    with open(path, 'rb') as file:
+        data = memoryview(bytearray(file.read()))
+
+    # a truncated or foreign file is recomputed and written again
+    if len(data) < HEADER.size:
+        return None
+
+    width, height, count = HEADER.unpack_from(data)
+    size = width * height * 4
+
+    if not count or len(data) != HEADER.size + size * count * len(STATES):
+        return None
+
+    offset = HEADER.size
+    outlines: dict[str, list[pg.Surface]] = {}
+
+    try:
+        for state in STATES:
+            outlines[state] = []
+
+            for _ in range(count):
+                frame = data[offset:offset + size]
+                outlines[state].append(pg.image.frombuffer(frame, (width, height), 'BGRA'))
+                offset += size
+    except ValueError:
+        return None
+
+    return outlines
+
+
+def save_outlines(path: str, outlines: dict[str, list[pg.Surface]]) -> None:
+    width, height = outlines[STATES[0]][0].get_size()
+
+    try:
+        makedirs(join(CACHE_DIR, 'outlines'), exist_ok=True)
+
+        # written next to the cache file and swapped in whole, so a launch
+        # killed mid write never leaves a partial file behind
+        with open(f'{path}.tmp', 'wb') as file:
+            file.write(HEADER.pack(width, height, len(outlines[STATES[0]])))
+
+            for state in STATES:
+                for frame in outlines[state]:
+                    file.write(pg.image.tobytes(frame, 'BGRA'))
+
+        replace(f'{path}.tmp', path)
+    except OSError:
+        # a read only install simply computes outlines every launch
+        pass
+
+
+def import_outlines(name: str, frames: dict[str, list[pg.Surface]], width: int):
+    path = outline_cache_path(name, width)
+    outlines = load_outlines(path)
+
+    if outlines is None:
+        outlines = calculate_monster_outlines({name: frames}, width)[name]
+        save_outlines(path, outlines)
+
+    return outlines
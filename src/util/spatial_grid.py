@@ -0,0 +1,129 @@
+from src.settings import *
+from math import floor
+from bisect import insort, bisect_left
+from heapq import merge
+from typing import Any, Callable
+
+
+class SpatialGrid:
+    def __init__(self, cell_size: int = SPATIAL_CELL_SIZE) -> None:
+        self.cell_size = cell_size
+        self.cells: dict[tuple[int, int], set] = {}
+
+        # every item remembers the cells it was inserted into
+        self.items: dict[object, list[tuple[int, int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, item) -> bool:
+        return item in self.items
+
+    def cell_keys(self, rect: pg.FRect) -> list[tuple[int, int]]:
+        left = floor(rect.left / self.cell_size)
+        top = floor(rect.top / self.cell_size)
+        # zero sized rects still live in the cell they sit on
+        right = floor(max(rect.left, rect.right - 1) / self.cell_size)
+        bottom = floor(max(rect.top, rect.bottom - 1) / self.cell_size)
+
+        return [
+            (x, y) for y in range(top, bottom + 1) for x in range(left, right + 1)
+        ]
+
+    def insert(self, item, rect: pg.FRect) -> None:
+        if item in self.items:
+            self.remove(item)
+
+        keys = self.cell_keys(rect)
+
+        for key in keys:
+            self.cells.setdefault(key, set()).add(item)
+
+        self.items[item] = keys
+
+    def remove(self, item) -> None:
+        for key in self.items.pop(item, ()):
+            cell = self.cells[key]
+            cell.discard(item)
+
+            if not cell:
+                del self.cells[key]
+
+    def move(self, item, rect: pg.FRect) -> bool:
+        # only touch the cells when the item crossed a cell boundary
+        if self.items.get(item) == self.cell_keys(rect):
+            return False
+
+        self.insert(item, rect)
+
+        return True
+
+    def query(self, rect: pg.FRect) -> set:
+        found = set()
+
+        for key in self.cell_keys(rect):
+            if key in self.cells:
+                found.update(self.cells[key])
+
+        return found
+
+    def clear(self) -> None:
+        self.cells.clear()
+        self.items.clear()
+
+
+class SortedSpatialGrid(SpatialGrid):
+    def __init__(self, key: Callable, cell_size: int = SPATIAL_CELL_SIZE) -> None:
+        super().__init__(cell_size)
+
+        # cells are lists kept sorted by each item's key, keys must be unique
+        self.key = key
+        self.cells: dict[tuple[int, int], list] = {}
+        self.keys: dict[object, Any] = {}
+
+    def insert(self, item, rect: pg.FRect) -> None:
+        if item in self.items:
+            self.remove(item)
+
+        self.keys[item] = self.key(item)
+        keys = self.cell_keys(rect)
+
+        for key in keys:
+            insort(self.cells.setdefault(key, []), item, key=self.keys.__getitem__)
+
+        self.items[item] = keys
+
+    def remove(self, item) -> None:
+        for key in self.items.pop(item, ()):
+            cell = self.cells[key]
+            del cell[bisect_left(cell, self.keys[item], key=self.keys.__getitem__)]
+
+            if not cell:
+                del self.cells[key]
+
+        self.keys.pop(item, None)
+
+    def move(self, item, rect: pg.FRect) -> bool:
+        # re-insert only when the item changed cells or its sort key changed
+        if self.items.get(item) == self.cell_keys(rect) and \
+                self.keys.get(item) == self.key(item):
+            return False
+
+        self.insert(item, rect)
+
+        return True
+
+    def query(self, rect: pg.FRect) -> list:
+        cells = [self.cells[key] for key in self.cell_keys(rect) if key in self.cells]
+        found = []
+
+        # an item spanning several cells comes out of the merge back to back
+        for item in merge(*cells, key=self.keys.__getitem__):
+            if not found or found[-1] is not item:
+                found.append(item)
+
+        return found
+
+    def clear(self) -> None:
+        super().clear()
+        self.keys.clear()
@@ -77,3 +77,12 @@ def flip_surfaces(surfaces: list[pg.Surface], horizontal: bool, vertical: bool)
         surfs.append(pg.transform.flip(surf, horizontal, vertical))
 
     return surfs
+
+
+def scale_visible(surf: pg.Surface) -> tuple[pg.Surface, pg.Rect]:
+    # scale2x only the part of the frame that shows, returns where it sits in the
+    # scaled frame. the margin keeps edge pixels from seeing the clipped neighbours
+    visible_rect = surf.get_bounding_rect().inflate(4, 4).clip(surf.get_rect())
+    scaled_surf = pg.transform.scale2x(surf.subsurface(visible_rect))
+
+    return scaled_surf, scaled_surf.get_rect(topleft=vector(visible_rect.topleft) * 2)
@@ -0,0 +1,56 @@
+from src.settings import *
+from collections import OrderedDict
+
+
+class TextCache:
+    def __init__(self, size: int = TEXT_CACHE_SIZE) -> None:
+        self.size = size
+        self.surfs: OrderedDict[tuple, pg.Surface] = OrderedDict()
+
+        # counters to keep an eye on how well the cache does
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font: pg.Font, text: str, antialias: bool, color) -> pg.Surface:
+        key = (font, text, antialias, color)
+
+        if key in self.surfs:
+            self.hits += 1
+            self.surfs.move_to_end(key)
+            return self.surfs[key]
+
+        self.misses += 1
+        surf = font.render(text, antialias, color)
+        self.surfs[key] = surf
+
+        # forget the least recently rendered text
+        if len(self.surfs) > self.size:
+            self.surfs.popitem(last=False)
+
+        return surf
+
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+
+        return self.hits / total if total else 0
+
+    def get_stats(self) -> dict[str, float]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hit_rate(),
+            'size': len(self.surfs)
+        }
+
+    def clear(self) -> None:
+        self.surfs.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+text_cache = TextCache()
+
+
+def render_text(font: pg.Font, text: str, antialias: bool, color) -> pg.Surface:
+    # surfaces are shared between callers, never draw on them
+    return text_cache.render(font, text, antialias, color)
@@ -0,0 +1,32 @@
+from src.settings import *
+from os.path import join
+from pytmx import TiledMap
+from pytmx.util_pygame import load_pygame
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+class TmxMaps:
+    def __init__(self, maps: dict[str, TiledMap], *path) -> None:
+        self.path = path
+
+        # bundled maps are parsed already, the rest is parsed on first use
+        self.maps = maps
+        self.pending: dict[str, Future] = {}
+        self.pool = ThreadPoolExecutor(1) if ASSET_WORKERS else None
+
+    def load(self, name: str) -> TiledMap:
+        return load_pygame(join(*self.path, f'{name}.tmx'))
+
+    def prefetch(self, name: str) -> None:
+        # without threads the map is simply parsed when it is needed
+        if name in self.maps or name in self.pending or not self.pool:
+            return
+
+        self.pending[name] = self.pool.submit(self.load, name)
+
+    def __getitem__(self, name: str) -> TiledMap:
+        if name not in self.maps:
+            future = self.pending.pop(name, None)
+            self.maps[name] = future.result() if future else self.load(name)
+
+        return self.maps[name]
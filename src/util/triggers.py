@@ -0,0 +1,65 @@
+from src.settings import *
+from src.util.spatial_grid import SpatialGrid
+from typing import Callable
+
+
+class Trigger:
+    def __init__(
+        self, rect: pg.FRect, on_enter: Callable | None = None, on_exit: Callable | None = None
+    ) -> None:
+        self.rect = rect
+        self.on_enter = on_enter
+        self.on_exit = on_exit
+
+
+class TriggerIndex:
+    def __init__(self, cell_size: int = TILE_SIZE) -> None:
+        self.grid = SpatialGrid(cell_size)
+        self.order: dict[Trigger, int] = {}
+
+        # the triggers sharing a cell with the hitbox, refreshed only
+        # when the hitbox crosses a cell boundary
+        self.cell_keys: list[tuple[int, int]] | None = None
+        self.nearby: list[Trigger] = []
+
+        self.inside: set[Trigger] = set()
+
+    def add(self, trigger: Trigger) -> Trigger:
+        self.grid.insert(trigger, trigger.rect)
+        self.order[trigger] = len(self.order)
+        self.cell_keys = None
+
+        return trigger
+
+    def reset(self) -> None:
+        # forget where the hitbox was, e.g. after the player was moved
+        self.cell_keys = None
+        self.nearby = []
+        self.inside.clear()
+
+    def update(self, hitbox: pg.FRect) -> None:
+        cell_keys = self.grid.cell_keys(hitbox)
+
+        if cell_keys != self.cell_keys:
+            self.cell_keys = cell_keys
+            self.nearby = sorted(self.grid.query(hitbox), key=self.order.__getitem__)
+
+        # most of the time nothing is nearby and this is a no-op
+        if not self.nearby and not self.inside:
+            return
+
+        inside = {trigger for trigger in self.nearby if trigger.rect.colliderect(hitbox)}
+
+        # every event fires once, on the frame the hitbox enters or leaves.
+        # an enter the handler turned down by returning False is not taken
+        # as inside, so it fires again while the hitbox stays on the trigger
+        for trigger in self.nearby:
+            if trigger in inside and trigger not in self.inside and trigger.on_enter:
+                if trigger.on_enter() is False:
+                    inside.discard(trigger)
+
+        for trigger in sorted(self.inside - inside, key=self.order.__getitem__):
+            if trigger.on_exit:
+                trigger.on_exit()
+
+        self.inside = inside
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from src.settings import *
+from src.groups import RenderGroup, CollisionGroup
+from src.util.triggers import TriggerIndex
+from src.regions import Regions
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.sprites.player import Player
+    from src.encounters import Encounters
+    from src.sprites.character import Character
+
+
+class BuiltWorld:
+    def __init__(self, name: str, size: tuple[int, int]) -> None:
+        self.name = name
+
+        self.render_group = RenderGroup()
+        self.collision_group = CollisionGroup(size)
+        self.character_group = pg.sprite.Group()
+        self.world_transitions = pg.sprite.Group()
+        self.triggers = TriggerIndex()
+        self.player: Player | None = None
+        self.encounters: Encounters | None = None
+
+        # start pos name -> (center, direction) of every player object
+        self.player_starts: dict[str, tuple[tuple[float, float], str]] = {}
+
+        self.regions = Regions()
+
+        # map order -> (center, direction) of released characters that
+        # already walked up to the player
+        self.character_states: dict[int, tuple[tuple[float, float], str]] = {}
+
+    def place_player(self, player_start_pos: str) -> None:
+        center, state = self.player_starts[player_start_pos]
+
+        # the player walks in like it was just created
+        self.player.rect.center = center
+        self.player.hitbox.center = center
+        self.player.state = state
+        self.player.direction = vector()
+        self.player.frame_index = 0
+        self.player.alerted = False
+        self.player.unblock()
+
+    def restore_character(self, order: int, character: Character) -> None:
+        if order in self.character_states:
+            center, state = self.character_states.pop(order)
+            character.rect.center = center
+            character.hitbox.center = center
+            character.state = state
+            character.has_moved = True
+
+    def release_region(self, key: tuple[int, int]) -> None:
+        region = self.regions.built.pop(key)
+
+        for order, character in region.characters.items():
+            if character.has_moved:
+                self.character_states[order] = (character.rect.center, character.state)
+
+        for patch in region.patches:
+            self.encounters.remove(patch)
+
+        for sprite in region.sprites:
+            sprite.kill()
+
+        for indices in region.rects:
+            self.collision_group.remove_rect(indices)
+
+    def release(self) -> None:
+        self.render_group.empty()
+        self.collision_group.empty()
+        self.character_group.empty()
+        self.world_transitions.empty()
+
+
+class WorldCache:
+    def __init__(self, size: int = WORLD_CACHE_SIZE) -> None:
+        self.size = size
+
+        # least recently entered world comes first
+        self.worlds: OrderedDict[str, BuiltWorld] = OrderedDict()
+
+    def get(self, name: str) -> BuiltWorld | None:
+        if name not in self.worlds:
+            return None
+
+        self.worlds.move_to_end(name)
+
+        return self.worlds[name]
+
+    def add(self, world: BuiltWorld) -> None:
+        self.worlds[world.name] = world
+
+        if len(self.worlds) > self.size:
+            _, oldest = self.worlds.popitem(last=False)
+            oldest.release()
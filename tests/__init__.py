@@ -0,0 +1,5 @@
+from os import environ
+
+# the tests draw into memory, no window or sound device needed
+environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+environ.setdefault('SDL_AUDIODRIVER', 'dummy')
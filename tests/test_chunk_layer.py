@@ -0,0 +1,56 @@
+import unittest
+from src.settings import *
+from src.groups import RenderGroup
+from src.textures.chunk_layer import ChunkCache, ChunkLayer
+from src.textures.animated_chunk_layer import AnimatedChunkLayer
+
+
+def setUpModule() -> None:
+    pg.init()
+    pg.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+
+class CountingCache(ChunkCache):
+    def __init__(self) -> None:
+        super().__init__()
+        self.baked: list[tuple] = []
+
+    def add(self, key: tuple, chunk, size: int) -> None:
+        self.baked.append(key)
+        super().add(key, chunk, size)
+
+
+class ChunkPanTest(unittest.TestCase):
+    def test_pan_over_a_screen_bakes_every_chunk_once(self) -> None:
+        cache = CountingCache()
+        terrain = ChunkLayer(cache=cache)
+        water = AnimatedChunkLayer(cache=cache)
+
+        tile = pg.Surface((TILE_SIZE, TILE_SIZE))
+        frames = [pg.Surface((TILE_SIZE, TILE_SIZE)) for _ in range(4)]
+
+        for x in range(0, 80 * TILE_SIZE, TILE_SIZE):
+            for y in range(0, 40 * TILE_SIZE, TILE_SIZE):
+                terrain.add((x, y), tile)
+                water.add((x, y), frames)
+
+        group = RenderGroup()
+        group.add_layer(terrain)
+        group.add_layer(water)
+
+        # back and forth over a whole screen, a few times
+        start = WINDOW_WIDTH
+        y = 20 * TILE_SIZE
+
+        for sweep in range(6):
+            xs = range(start, start + WINDOW_WIDTH, TILE_SIZE // 4)
+
+            for x in xs if sweep % 2 == 0 else reversed(xs):
+                group.draw(vector(x, y))
+
+        self.assertTrue(cache.baked)
+        self.assertEqual(len(cache.baked), len(set(cache.baked)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+from time import perf_counter, sleep
+from src.settings import *
+from src.overlays.transition import Transition
+
+
+def setUpModule() -> None:
+    pg.init()
+    pg.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+
+def steps(count: int, cost: float, done: list[int]):
+    for i in range(count):
+        sleep(cost)
+        done.append(i)
+        yield
+
+
+class TransitionBuildTest(unittest.TestCase):
+    def test_build_stops_before_a_step_would_overrun_the_budget(self) -> None:
+        # three of these are more than a frame's budget, two are not
+        cost = SETUP_FRAME_BUDGET / 1000 * 0.35
+        done: list[int] = []
+
+        transition = Transition()
+        transition.builder = steps(9, cost, done)
+
+        frames = 0
+
+        while transition.builder:
+            start = perf_counter()
+            transition.build()
+            elapsed = (perf_counter() - start) * 1000
+            frames += 1
+
+            self.assertLess(elapsed, SETUP_FRAME_BUDGET)
+
+        self.assertEqual(done, list(range(9)))
+        self.assertGreaterEqual(frames, 5)
+
+    def test_build_runs_a_step_longer_than_the_budget_on_its_own(self) -> None:
+        cost = SETUP_FRAME_BUDGET / 1000 * 1.5
+        done: list[int] = []
+
+        transition = Transition()
+        transition.builder = steps(3, cost, done)
+
+        transition.build()
+        self.assertEqual(done, [0])
+
+        transition.build()
+        self.assertEqual(done, [0, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
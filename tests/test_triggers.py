@@ -0,0 +1,64 @@
+import unittest
+from src.settings import *
+from src.overlays.transition import Transition
+from src.util.triggers import Trigger, TriggerIndex
+
+
+def setUpModule() -> None:
+    pg.init()
+    pg.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+
+class TriggerDuringTransitionTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.transition = Transition()
+        self.entered: list[int] = []
+
+        self.triggers = TriggerIndex()
+        self.triggers.add(Trigger(pg.FRect(TILE_SIZE * 4, TILE_SIZE * 4, TILE_SIZE, TILE_SIZE), self.change_world))
+
+    def change_world(self) -> bool:
+        # what a world transition does while another transition is running
+        if self.transition.in_transition:
+            return False
+
+        self.entered.append(1)
+        return True
+
+    def finish_transition(self) -> None:
+        while self.transition.in_transition:
+            self.transition.update(1 / 60)
+
+    def test_trigger_entered_during_a_transition_fires_once_it_is_over(self) -> None:
+        outside = pg.FRect(0, 0, TILE_SIZE, TILE_SIZE)
+        on_trigger = pg.FRect(TILE_SIZE * 4, TILE_SIZE * 4, TILE_SIZE, TILE_SIZE)
+
+        self.triggers.update(outside)
+        self.transition.start(lambda: None)
+
+        self.triggers.update(on_trigger)
+        self.assertEqual(self.entered, [])
+
+        self.finish_transition()
+
+        self.triggers.update(on_trigger)
+        self.assertEqual(self.entered, [1])
+
+        # accepted, so standing on it does not fire it again
+        self.triggers.update(on_trigger)
+        self.assertEqual(self.entered, [1])
+
+    def test_trigger_declined_and_left_does_not_fire_later(self) -> None:
+        self.transition.start(lambda: None)
+
+        self.triggers.update(pg.FRect(TILE_SIZE * 4, TILE_SIZE * 4, TILE_SIZE, TILE_SIZE))
+        self.triggers.update(pg.FRect(0, 0, TILE_SIZE, TILE_SIZE))
+
+        self.finish_transition()
+
+        self.triggers.update(pg.FRect(0, 0, TILE_SIZE, TILE_SIZE))
+        self.assertEqual(self.entered, [])
+
+
+if __name__ == '__main__':
+    unittest.main()